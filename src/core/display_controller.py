@@ -36,6 +36,11 @@ class DisplayController:
         """
         self.config = config or Config
 
+        # Special mode ("holiday", "year_end" or None) of the last checked day,
+        # keyed by (date, birthday, anniversary) so config edits still apply
+        self._special_mode_key: tuple | None = None
+        self._special_mode: str | None = None
+
     def get_current_mode(self, now: pendulum.DateTime | None = None) -> str:
         """Determine current display mode based on time and configuration.
 
@@ -53,6 +58,28 @@ class DisplayController:
         if now is None:
             now = pendulum.now(self.config.hardware.timezone)
 
+        # Holiday and year-end only change with the date, so they are evaluated
+        # once per day instead of on every refresh
+        key = (now.date(), self.config.BIRTHDAY, self.config.ANNIVERSARY)
+        if key != self._special_mode_key:
+            self._special_mode = self._detect_special_mode(now)
+            self._special_mode_key = key
+
+        if self._special_mode:
+            return self._special_mode
+
+        # Use configured mode
+        return self.config.display.mode
+
+    def _detect_special_mode(self, now: pendulum.DateTime) -> str | None:
+        """Check whether today calls for a special display mode.
+
+        Args:
+            now: Current time
+
+        Returns:
+            "holiday", "year_end" or None
+        """
         # Check for holiday
         holiday_manager = HolidayManager()
         if holiday_manager.get_holiday():
@@ -64,8 +91,7 @@ class DisplayController:
             logger.info("🎊 Year-end detected, using year-end mode")
             return "year_end"
 
-        # Use configured mode
-        return self.config.display.mode
+        return None
 
     def get_refresh_interval(self, mode: str) -> int:
         """Get refresh interval for a display mode.
@@ -7,6 +7,9 @@ logger = logging.getLogger(__name__)
 
 
 class WaveshareEPDDriver:
+    # Models whose getbuffer() packs B/W images as inverted 1-bit rows (1 = black)
+    _INVERTED_1BIT_MODELS = frozenset({"epd7in5_V2"})
+
     def __init__(self, model_name: str, use_grayscale: bool = False):
         """
         初始化 Waveshare 驱动适配器
@@ -23,6 +26,10 @@ class WaveshareEPDDriver:
             self.width = self.epd.width
             self.height = self.epd.height
             self.use_grayscale = use_grayscale
+            self.model_name = model_name
+
+            # B/W frame buffer reused across refreshes (see _pack_bw)
+            self._bw_buffer: bytearray | None = None
 
             # Check if grayscale is supported
             if use_grayscale:
@@ -85,14 +92,42 @@ class WaveshareEPDDriver:
         """
         # If image is explicitly B/W ("1"), use standard getbuffer
         if image.mode == "1":
-            return self.epd.getbuffer(image)
+            return self._pack_bw(image)
 
         # If image is grayscale ("L") and driver supports it, use grayscale buffer
         if self.use_grayscale and hasattr(self.epd, "getbuffer_4Gray"):
             return self.epd.getbuffer_4Gray(image)
 
         # Fallback: convert to B/W buffer
-        return self.epd.getbuffer(image)
+        return self._pack_bw(image)
+
+    def _pack_bw(self, image: Image.Image):
+        """Pack an image into the B/W display buffer.
+
+        For models with inverted 1-bit rows this lets Pillow's C packer do the
+        inversion ("1;I") instead of the driver's per-byte Python loop, and
+        fills one bytearray reused across refreshes. The buffer is overwritten
+        by the next call, so it must be sent to the panel before then.
+
+        Args:
+            image: PIL Image to convert
+
+        Returns:
+            Buffer in the format expected by the display
+        """
+        native_size = image.size == (self.width, self.height)
+        if self.model_name not in self._INVERTED_1BIT_MODELS or not native_size:
+            return self.epd.getbuffer(image)
+
+        if image.mode != "1":
+            image = image.convert("1")
+        packed = image.tobytes("raw", "1;I")
+
+        if self._bw_buffer is None or len(self._bw_buffer) != len(packed):
+            self._bw_buffer = bytearray(packed)
+        else:
+            self._bw_buffer[:] = packed
+        return self._bw_buffer
 
     def display(self, image: Image.Image) -> None:
         """Display an image on the e-ink screen.
@@ -119,7 +154,7 @@ class WaveshareEPDDriver:
             buffer = self.epd.getbuffer_4Gray(image)
             self.epd.display_4Gray(buffer)
         else:
-            buffer = self.epd.getbuffer(image)
+            buffer = self._pack_bw(image)
             self.epd.display(buffer)
 
     def display_partial_buffer(
@@ -6,6 +6,6 @@ This package contains layouts for:
 - Quote: Famous quotes display
 """
 
-from .dashboard import DashboardLayout
+from .dashboard import DashboardLayout, get_dashboard_layout
 
-__all__ = ["DashboardLayout"]
+__all__ = ["DashboardLayout", "get_dashboard_layout"]
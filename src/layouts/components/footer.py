@@ -1,25 +1,57 @@
 """Footer component for dashboard layout."""
 
+import functools
 import logging
 from typing import Any
 
 from PIL import ImageDraw
 
+from ...config import Config
 from ...renderer.dashboard import DashboardRenderer
-from ..utils.layout_helper import LayoutConstants, LayoutHelper
+from ..utils.layout_helper import LayoutConstants, get_layout_helper
 
 logger = logging.getLogger(__name__)
 
+# Pending centered-text draws grouped by font: font -> [(x, y, text, align_y_center)]
+TextOps = dict[Any, list[tuple[int, int, str, bool]]]
+
+
+@functools.lru_cache(maxsize=8)
+def _format_btc(usd: Any, change: float) -> tuple[str, str]:
+    """Format the BTC value and label, cached by the raw price data."""
+    return f"${usd:,}", f"BTC ({change:+.1f}%)"
+
+
+@functools.lru_cache(maxsize=32)
+def _format_percent(value: Any) -> str:
+    """Format a ring's percentage text, cached by value (rings sit on a 0-100 scale)."""
+    return f"{value}%"
+
 
 class FooterComponent:
     """Handles rendering of the dashboard footer section."""
 
+    # Slot labels that never change between frames. ``None`` marks a slot whose
+    # label is computed per frame (the BTC label carries the 24h change).
+    STATIC_LABELS = ("Weekly", "Commits", None, "VPS Data")
+
+    # Value renderer per slot, matching STATIC_LABELS
+    ITEM_TYPES = ("ring", "cross", "text", "ring")
+
+    # Keys of a "cross" value, in top-left, top-right, bottom-left, bottom-right order
+    CROSS_KEYS = ("day", "week", "month", "year")
+
     def __init__(self, renderer: DashboardRenderer):
         self.renderer = renderer
-        self.layout = LayoutHelper(use_grayscale=False)  # Will be updated based on Config if needed
+        self.layout = get_layout_helper(Config.hardware.use_grayscale)
         self.FOOTER_CENTER_Y = 410
         self.FOOTER_LABEL_Y = 445
 
+        # Static labels come from a fixed set; measure and rasterize them up front
+        renderer.warm_up_text(
+            [renderer.font_s], [label for label in self.STATIC_LABELS if label is not None]
+        )
+
     def draw(
         self,
         draw: ImageDraw.ImageDraw,
@@ -41,51 +73,78 @@ class FooterComponent:
         """
         r = self.renderer
 
-        # Construct BTC string
-        btc_val = f"${btc_data.get('usd', 0):,}"
-        change = btc_data.get("usd_24h_change", 0.0)
-        btc_label = f"BTC ({change:+.1f}%)"
-
-        # Define footer components
-        footer_items = [
-            {"label": "Weekly", "value": week_prog, "type": "ring"},
-            {"label": "Commits", "value": commits, "type": "cross"},
-            {"label": btc_label, "value": btc_val, "type": "text"},
-            {"label": "VPS Data", "value": vps_data, "type": "ring"},
-        ]
-
-        # Calculate dynamic layout using LayoutHelper
-        col_layout = self.layout.create_column_layout(
-            width, len(footer_items), padding=LayoutConstants.MARGIN_SMALL
+        # Construct BTC strings
+        btc_val, btc_label = _format_btc(
+            btc_data.get("usd", 0), btc_data.get("usd_24h_change", 0.0)
         )
 
-        # Loop to draw components
-        for i, item in enumerate(footer_items):
-            center_x = col_layout.get_column_center(i)
+        # Per-slot values and dynamic labels matching ITEM_TYPES (static labels
+        # are drawn by draw_static)
+        values = (week_prog, commits, btc_val, vps_data)
+        labels = (None, None, btc_label, None)
 
-            # Draw label
-            r.draw_centered_text(
+        # Column centers are memoized by LayoutHelper for a fixed width
+        centers = self.layout.get_column_centers(
+            width, len(self.ITEM_TYPES), padding=LayoutConstants.MARGIN_SMALL
+        )
+
+        # Pass 1: draw shapes and collect text draws grouped by font
+        text_ops: TextOps = {}
+        font_s = r.font_s
+        label_y = self.FOOTER_LABEL_Y
+        for center_x, item_type, label, value in zip(
+            centers, self.ITEM_TYPES, labels, values, strict=True
+        ):
+            # Dynamic label
+            if label:
+                text_ops.setdefault(font_s, []).append((center_x, label_y, label, False))
+
+            # Value based on type
+            if item_type == "ring":
+                self._layout_ring_item(draw, center_x, value, text_ops)
+            elif item_type == "cross":
+                self._layout_cross_item(draw, center_x, value, text_ops)
+            elif item_type == "text":
+                self._layout_text_item(center_x, str(value), text_ops)
+            else:
+                logger.warning(f"Unknown footer item type: {item_type}")
+                self._layout_text_item(center_x, str(value), text_ops)
+
+        # Pass 2: draw all text one font at a time. Footer strings (numbers,
+        # percentages) repeat across refreshes, so they come from cached sprites
+        draw_centered_text = r.draw_centered_cached_text
+        for font, ops in text_ops.items():
+            for x, y, text, align_y_center in ops:
+                draw_centered_text(draw, x, y, text, font=font, align_y_center=align_y_center)
+
+    def draw_static(self, draw: ImageDraw.ImageDraw, width: int) -> None:
+        """Draw the footer labels that never change between frames.
+
+        Args:
+            draw: PIL ImageDraw object
+            width: Canvas width
+        """
+        r = self.renderer
+        centers = self.layout.get_column_centers(
+            width, len(self.STATIC_LABELS), padding=LayoutConstants.MARGIN_SMALL
+        )
+
+        for center_x, label in zip(centers, self.STATIC_LABELS, strict=True):
+            if label is None:
+                continue
+            r.draw_centered_cached_text(
                 draw,
                 center_x,
                 self.FOOTER_LABEL_Y,
-                item["label"],
+                label,
                 font=r.font_s,
                 align_y_center=False,
             )
 
-            # Draw value based on type
-            if item["type"] == "ring":
-                self._draw_ring_item(draw, center_x, item["value"])
-            elif item["type"] == "cross":
-                self._draw_cross_item(draw, center_x, item["value"])
-            elif item["type"] == "text":
-                self._draw_text_item(draw, center_x, str(item["value"]))
-            else:
-                logger.warning(f"Unknown footer item type: {item['type']}")
-                self._draw_text_item(draw, center_x, str(item["value"]))
-
-    def _draw_ring_item(self, draw: ImageDraw.ImageDraw, center_x: int, value: int) -> None:
-        """Draw a ring progress item."""
+    def _layout_ring_item(
+        self, draw: ImageDraw.ImageDraw, center_x: int, value: int, text_ops: TextOps
+    ) -> None:
+        """Draw a ring progress item and queue its percentage text."""
         r = self.renderer
         radius = 32
         r.draw_progress_ring(
@@ -96,90 +155,50 @@ class FooterComponent:
             value,
             thickness=6,
         )
-        r.draw_centered_text(
-            draw,
-            center_x,
-            self.FOOTER_CENTER_Y,
-            f"{value}%",
-            font=r.font_xs,
-            align_y_center=True,
+        text_ops.setdefault(r.font_xs, []).append(
+            (center_x, self.FOOTER_CENTER_Y, _format_percent(value), True)
         )
 
-    def _draw_text_item(self, draw: ImageDraw.ImageDraw, center_x: int, value: str) -> None:
-        """Draw a simple text item."""
-        r = self.renderer
-        r.draw_centered_text(
-            draw,
-            center_x,
-            self.FOOTER_CENTER_Y,
-            value,
-            font=r.font_date_big,
-            align_y_center=True,
+    def _layout_text_item(self, center_x: int, value: str, text_ops: TextOps) -> None:
+        """Queue a simple text item."""
+        text_ops.setdefault(self.renderer.font_date_big, []).append(
+            (center_x, self.FOOTER_CENTER_Y, value, True)
         )
 
-    def _draw_cross_item(self, draw: ImageDraw.ImageDraw, center_x: int, value: Any) -> None:
-        """Draw a cross layout item (typically for GitHub stats)."""
+    def _layout_cross_item(
+        self, draw: ImageDraw.ImageDraw, center_x: int, value: Any, text_ops: TextOps
+    ) -> None:
+        """Draw a cross layout item (typically for GitHub stats) and queue its numbers."""
         r = self.renderer
 
-        # Special handling for GitHub stats (dictionary)
-        if (
-            isinstance(value, dict)
-            and "day" in value
-            and "week" in value
-            and "month" in value
-            and "year" in value
-        ):
-            offset_x = 25
-            offset_y = 15
-
-            # Top-left: Day
-            r.draw_centered_text(
-                draw,
-                center_x - offset_x,
-                self.FOOTER_CENTER_Y - offset_y,
-                str(value["day"]),
-                font=r.font_commits,
-                align_y_center=True,
-            )
-
-            # Top-right: Week
-            r.draw_centered_text(
-                draw,
-                center_x + offset_x,
-                self.FOOTER_CENTER_Y - offset_y,
-                str(value["week"]),
-                font=r.font_commits,
-                align_y_center=True,
-            )
+        # Special handling for GitHub stats (dictionary); anything else falls
+        # back to plain text
+        if not (isinstance(value, dict) and all(key in value for key in self.CROSS_KEYS)):
+            self._layout_text_item(center_x, str(value), text_ops)
+            return
+        day, week, month, year = (value[key] for key in self.CROSS_KEYS)
 
-            # Bottom-left: Month
-            r.draw_centered_text(
-                draw,
-                center_x - offset_x,
-                self.FOOTER_CENTER_Y + offset_y,
-                str(value["month"]),
-                font=r.font_commits,
-                align_y_center=True,
-            )
+        offset_x = 25
+        offset_y = 15
+        y = self.FOOTER_CENTER_Y
 
-            # Bottom-right: Year
-            r.draw_centered_text(
-                draw,
-                center_x + offset_x,
-                self.FOOTER_CENTER_Y + offset_y,
-                str(value["year"]),
-                font=r.font_commits,
-                align_y_center=True,
-            )
+        # Draw cross lines using LayoutHelper
+        self.layout.draw_cross_divider(
+            draw,
+            center_x,
+            y,
+            h_length=(offset_x + 15) * 2,
+            v_length=(offset_y + 10) * 2,
+        )
 
-            # Draw cross lines using LayoutHelper
-            self.layout.draw_cross_divider(
-                draw,
-                center_x,
-                self.FOOTER_CENTER_Y,
-                h_length=(offset_x + 15) * 2,
-                v_length=(offset_y + 10) * 2,
+        # Day (top-left), week (top-right), month (bottom-left), year (bottom-right)
+        left_x, right_x = center_x - offset_x, center_x + offset_x
+        top_y, bottom_y = y - offset_y, y + offset_y
+        text_ops.setdefault(r.font_commits, []).extend(
+            (
+                (left_x, top_y, str(day), True),
+                (right_x, top_y, str(week), True),
+                (left_x, bottom_y, str(month), True),
+                (right_x, bottom_y, str(year), True),
             )
-        else:
-            # Fallback to text if not a valid dict
-            self._draw_text_item(draw, center_x, str(value))
+        )
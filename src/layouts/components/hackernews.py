@@ -1,23 +1,34 @@
 """HackerNews component for dashboard layout."""
 
+import functools
 import logging
 from typing import Any
 
-from PIL import ImageDraw
+from PIL import ImageDraw, ImageFont
 
 from ...config import Config
 from ...renderer.dashboard import DashboardRenderer
-from ..utils.layout_helper import LayoutConstants, LayoutHelper
+from ..utils.layout_helper import LayoutConstants, get_layout_helper
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=256)
+def _score_width(font: ImageFont.FreeTypeFont, score_text: str) -> int:
+    """Measure a story's score label once per (font, text); scores repeat across refreshes."""
+    try:
+        score_bbox = font.getbbox(score_text)
+        return score_bbox[2] - score_bbox[0]
+    except Exception:
+        return 30
+
+
 class HackerNewsComponent:
     """Handles rendering of the HackerNews section."""
 
     def __init__(self, renderer: DashboardRenderer):
         self.renderer = renderer
-        self.layout = LayoutHelper(use_grayscale=Config.hardware.use_grayscale)
+        self.layout = get_layout_helper(Config.hardware.use_grayscale)
         self.LIST_HEADER_Y = 115
         self.LIST_START_Y = 155
         self.LINE_H = 40
@@ -44,8 +55,8 @@ class HackerNewsComponent:
             end_idx = hn_data.get("end_idx", 5)
             header_text = f"HN {start_idx}~{end_idx}"
 
-        # Draw header
-        r.draw_centered_text(
+        # Draw header (one of a few page ranges, so it comes from a cached sprite)
+        r.draw_centered_cached_text(
             draw,
             width // 2,
             self.LIST_HEADER_Y,
@@ -54,7 +65,14 @@ class HackerNewsComponent:
             align_y_center=False,
         )
 
-        # Draw stories
+        # Pass 1: lay out every story from memoized measurements (titles and
+        # scores repeat across consecutive polls)
+        font_s = r.font_s
+        fontmode = draw.fontmode
+        # Title budget before the score is subtracted (side margins and gap)
+        title_budget = width - 80 - 20
+        score_right = width - 40
+        plans = []
         for i, story in enumerate(stories):
             y = self.LIST_START_Y + i * self.LINE_H
             title = story.get("title", "")
@@ -65,33 +83,29 @@ class HackerNewsComponent:
             right_text = f"{score}▲"
 
             # Calculate available width for title
-            try:
-                score_bbox = r.font_s.getbbox(right_text)
-                score_width = score_bbox[2] - score_bbox[0]
-            except Exception:
-                score_width = 30
-
-            title_max_width = width - 80 - score_width - 20
-
-            # Draw left-aligned title (truncated)
-            r.draw_truncated_text(
-                draw,
-                40,
-                y,
-                left_text,
-                r.font_s,
-                title_max_width,
-            )
-
-            # Draw right-aligned score
-            draw.text(
-                (width - 40 - score_width, y),
-                right_text,
-                font=r.font_s,
-                fill=0,
-            )
-
-        # Draw divider line using LayoutHelper
+            score_width = _score_width(font_s, right_text)
+            title_max_width = title_budget - score_width
+
+            # Left-aligned title (truncated) and right-aligned score
+            title_text = r.fit_text(left_text, font_s, title_max_width, fontmode)
+            plans.append((y, title_text, right_text, score_right - score_width))
+
+        # Pass 2: draw the text. Titles and scores change with every page
+        # rotation, so they are drawn directly instead of going through the
+        # sprite cache, where they would evict the labels reused every frame
+        draw_text = draw.text
+        for y, title_text, right_text, score_x in plans:
+            if title_text is not None:
+                draw_text((40, y), title_text, font=font_s, fill=0)
+            draw_text((score_x, y), right_text, font=font_s, fill=0)
+
+    def draw_static(self, draw: ImageDraw.ImageDraw, width: int) -> None:
+        """Draw the bottom divider (unchanged between frames).
+
+        Args:
+            draw: PIL ImageDraw object
+            width: Canvas width
+        """
         self.layout.draw_horizontal_divider(
             draw, self.LINE_BOTTOM_Y, width=width, line_width=LayoutConstants.LINE_NORMAL
         )
@@ -1,5 +1,7 @@
 """Header component for dashboard layout."""
 
+import datetime
+import functools
 import logging
 from typing import Any
 
@@ -7,20 +9,77 @@ from PIL import ImageDraw
 
 from ...config import Config
 from ...renderer.dashboard import DashboardRenderer
-from ..utils.layout_helper import LayoutConstants, LayoutHelper
+from ..utils.layout_helper import LayoutConstants, get_layout_helper
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=4)
+def _format_date(date: datetime.date) -> tuple[str, str]:
+    """Format the header date lines ("Fri, 14", "Mar 2025"), cached per day."""
+    return date.strftime("%a, %d"), date.strftime("%b %Y")
+
+
+@functools.lru_cache(maxsize=4)
+def _format_time(hour: int, minute: int) -> str:
+    """Format the "Updated" time value, cached per minute."""
+    return f"{hour:02d}:{minute:02d}"
+
+
 class HeaderComponent:
     """Handles rendering of the dashboard header section."""
 
+    # OpenWeatherMap "main" condition -> weather icon name (fallback: "cloud")
+    _WEATHER_ICON = {
+        "Clear": "sun",
+        "Sun": "sun",
+        "Clouds": "cloud",
+        "Rain": "rain",
+        "Drizzle": "rain",
+        "Snow": "snow",
+        "Thunderstorm": "thunder",
+    }
+
+    # Condition names shortened for display
+    _DESC_REMAP = {"Clouds": "Cloudy", "Thunderstorm": "Storm"}
+
+    # OpenWeatherMap "main" conditions reported as the weather description
+    WEATHER_CONDITIONS = ("Clear", "Clouds", "Rain", "Drizzle", "Snow", "Thunderstorm")
+
+    # Label above the last update time
+    UPDATED_LABEL = "Updated"
+
+    # Header slots, left to right; per-frame payloads are passed alongside
+    ITEM_TYPES = ("date", "weather", "greeting", "time")
+
     def __init__(self, renderer: DashboardRenderer):
         self.renderer = renderer
-        self.layout = LayoutHelper(use_grayscale=Config.hardware.use_grayscale)
+        self.layout = get_layout_helper(Config.hardware.use_grayscale)
         self.TOP_Y = LayoutConstants.MARGIN_SMALL
         self.LINE_TOP_Y = 100
         self.WEATHER_ICON_SIZE = 30
+        self.WEATHER_ICON_GAP = 2
+        self.WEATHER_TEXT_DY = -16  # Description text offset from the icon row
+        self._icon_plus_gap = self.WEATHER_ICON_SIZE + self.WEATHER_ICON_GAP
+        self.NUM_ITEMS = len(self.ITEM_TYPES)
+        self.TIME_SLOT = self.ITEM_TYPES.index("time")
+
+        # Item type -> drawing method
+        self._HEADER_DRAWERS = {
+            "weather": self._draw_weather_item,
+            "date": self._draw_date_item,
+            "time": self._draw_time_item,
+            "greeting": self._draw_greeting_item,
+            "custom": self._draw_custom_item,
+        }
+
+        # The label and weather descriptions come from fixed sets; measure and
+        # rasterize them up front
+        renderer.warm_up_text(
+            [renderer.font_s],
+            [self.UPDATED_LABEL]
+            + [self._DESC_REMAP.get(name, name) for name in self.WEATHER_CONDITIONS],
+        )
 
     def draw(
         self, draw: ImageDraw.ImageDraw, width: int, now: Any, weather: dict[str, Any]
@@ -33,24 +92,47 @@ class HeaderComponent:
             now: Current datetime
             weather: Weather data dictionary
         """
-        # Define components to display
-        header_items = [
-            {"type": "date", "data": now},
-            {"type": "weather", "data": weather},
-            {"type": "greeting"},
-            {"type": "time", "data": now},
-        ]
-
-        # Calculate dynamic layout using LayoutHelper
+        # Per-slot payloads matching ITEM_TYPES; date/time strings are cached
+        # per day / minute
+        payloads = (
+            _format_date(now.date()),
+            weather,
+            None,
+            _format_time(now.hour, now.minute),
+        )
+
+        # Column centers are memoized by LayoutHelper for a fixed width
         # Use MARGIN_SMALL to match footer's uniform distribution
-        col_layout = self.layout.create_column_layout(
-            width, len(header_items), padding=LayoutConstants.MARGIN_SMALL
+        centers = self.layout.get_column_centers(
+            width, self.NUM_ITEMS, padding=LayoutConstants.MARGIN_SMALL
         )
 
         # Draw each component
-        for i, item in enumerate(header_items):
-            center_x = col_layout.get_column_center(i)
-            self._draw_component(draw, center_x, self.TOP_Y, item)
+        for center_x, item_type, payload in zip(centers, self.ITEM_TYPES, payloads, strict=True):
+            self._draw_component(draw, center_x, self.TOP_Y, item_type, payload)
+
+    def draw_static(self, draw: ImageDraw.ImageDraw, width: int) -> None:
+        """Draw the parts of the header that never change between frames.
+
+        Args:
+            draw: PIL ImageDraw object
+            width: Canvas width
+        """
+        r = self.renderer
+        centers = self.layout.get_column_centers(
+            width, self.NUM_ITEMS, padding=LayoutConstants.MARGIN_SMALL
+        )
+
+        # "Updated" label above the time value
+        r.draw_centered_cached_text(
+            draw,
+            centers[self.TIME_SLOT],
+            self.TOP_Y,
+            self.UPDATED_LABEL,
+            font=r.font_s,
+            fill=r.COLOR_BLACK,
+            align_y_center=False,
+        )
 
         # Draw divider line using LayoutHelper with matching margins
         self.layout.draw_horizontal_divider(
@@ -62,146 +144,145 @@ class HeaderComponent:
         )
 
     def _draw_component(
-        self, draw: ImageDraw.ImageDraw, center_x: int, top_y: int, item_data: dict[str, Any]
+        self, draw: ImageDraw.ImageDraw, center_x: int, top_y: int, item_type: str, payload: Any
     ) -> None:
         """Draw individual header component."""
+        drawer = self._HEADER_DRAWERS.get(item_type)
+        if drawer is None:
+            logger.warning(f"Unknown header item type: {item_type}")
+            return
+        drawer(draw, center_x, top_y, payload)
+
+    def _draw_weather_item(
+        self, draw: ImageDraw.ImageDraw, center_x: int, top_y: int, payload: Any
+    ) -> None:
+        """Draw city/temperature and the weather icon with description."""
+        r = self.renderer
+        font_s = r.font_s
+        black = r.COLOR_BLACK
+        data = payload
+        # Line 1: City and temperature
+        r.draw_centered_text(
+            draw,
+            center_x,
+            top_y,
+            f"{Config.CITY_NAME} {data.get('temp', '--')}°",
+            font=r.font_m,
+            fill=black,
+            align_y_center=False,
+        )
+
+        # Line 2: Icon + description (vertically centered)
+        icon_y = top_y + 55
+
+        # Determine icon name and display description
+        icon_name = self._WEATHER_ICON.get(data.get("icon", ""), "cloud")
+        desc = data.get("desc", "--")
+        desc = self._DESC_REMAP.get(desc, desc)
+
+        # Calculate centering for icon + text combination
+        icon_plus_gap = self._icon_plus_gap
+        try:
+            text_bbox = r.get_text_bbox(desc, font_s)
+            text_width = text_bbox[2] - text_bbox[0]
+        except Exception:
+            text_width = 40  # Fallback
+
+        start_x = center_x - ((icon_plus_gap + text_width) // 2)
+
+        r.draw_weather_icon(draw, start_x, icon_y, icon_name, size=self.WEATHER_ICON_SIZE)
+        r.draw_cached_text(
+            draw, start_x + icon_plus_gap, icon_y + self.WEATHER_TEXT_DY, desc, font_s, black
+        )
+
+    def _draw_date_item(
+        self, draw: ImageDraw.ImageDraw, center_x: int, top_y: int, payload: Any
+    ) -> None:
+        """Draw weekday/day and month/year."""
+        r = self.renderer
+        date_big, date_small = payload
+        r.draw_centered_text(
+            draw,
+            center_x,
+            top_y,
+            date_big,
+            font=r.font_date_big,
+            fill=r.COLOR_BLACK,
+            align_y_center=False,
+        )
+
+        r.draw_centered_text(
+            draw,
+            center_x,
+            top_y + 40,
+            date_small,
+            font=r.font_s,
+            fill=r.COLOR_BLACK,
+            align_y_center=False,
+        )
+
+    def _draw_time_item(
+        self, draw: ImageDraw.ImageDraw, center_x: int, top_y: int, payload: Any
+    ) -> None:
+        """Draw the last update time."""
         r = self.renderer
-        item_type = item_data["type"]
-
-        match item_type:
-            case "weather":
-                data = item_data["data"]
-                # Line 1: City and temperature
-                r.draw_centered_text(
-                    draw,
-                    center_x,
-                    top_y,
-                    f"{Config.CITY_NAME} {data.get('temp', '--')}°",
-                    font=r.font_m,
-                    fill=r.COLOR_BLACK,
-                    align_y_center=False,
-                )
-
-                # Line 2: Icon + description (vertically centered)
-                icon_y = top_y + 55
-                w_main = data.get("icon", "")
-
-                # Determine icon name
-                icon_name = "cloud"
-                if "Clear" in w_main or "Sun" in w_main:
-                    icon_name = "sun"
-                elif "Rain" in w_main or "Drizzle" in w_main:
-                    icon_name = "rain"
-                elif "Snow" in w_main:
-                    icon_name = "snow"
-                elif "Thunder" in w_main:
-                    icon_name = "thunder"
-
-                # Process description text
-                desc = data.get("desc", "--")
-                if desc == "Clouds":
-                    desc = "Cloudy"
-                if desc == "Thunderstorm":
-                    desc = "Storm"
-
-                # Calculate centering for icon + text combination
-                icon_size = self.WEATHER_ICON_SIZE
-                try:
-                    text_bbox = r.font_s.getbbox(desc)
-                    text_width = text_bbox[2] - text_bbox[0]
-                except Exception:
-                    text_width = 40  # Fallback
-
-                total_width = icon_size + 2 + text_width
-                start_x = center_x - (total_width // 2)
-                icon_x = start_x
-                text_x = start_x + icon_size + 2
-
-                r.draw_weather_icon(draw, icon_x, icon_y, icon_name, size=icon_size)
-                draw.text((text_x, icon_y - 16), desc, font=r.font_s, fill=r.COLOR_BLACK)
-
-            case "date":
-                data = item_data["data"]
-                weekday = data.strftime("%a")
-                day = data.strftime("%d")
-                r.draw_centered_text(
-                    draw,
-                    center_x,
-                    top_y,
-                    f"{weekday}, {day}",
-                    font=r.font_date_big,
-                    fill=r.COLOR_BLACK,
-                    align_y_center=False,
-                )
-
-                month_year = data.strftime("%b %Y")
-                r.draw_centered_text(
-                    draw,
-                    center_x,
-                    top_y + 40,
-                    month_year,
-                    font=r.font_s,
-                    fill=r.COLOR_BLACK,
-                    align_y_center=False,
-                )
-
-            case "time":
-                data = item_data["data"]
-                r.draw_centered_text(
-                    draw,
-                    center_x,
-                    top_y,
-                    "Updated",
-                    font=r.font_s,
-                    fill=r.COLOR_BLACK,
-                    align_y_center=False,
-                )
-                r.draw_centered_text(
-                    draw,
-                    center_x,
-                    top_y + 35,
-                    data.strftime("%H:%M"),
-                    font=r.font_m,
-                    fill=r.COLOR_BLACK,
-                    align_y_center=False,
-                )
-
-            case "greeting":
-                r.draw_centered_text(
-                    draw,
-                    center_x,
-                    top_y,
-                    Config.GREETING_LABEL,
-                    font=r.font_m,
-                    fill=r.COLOR_BLACK,
-                    align_y_center=False,
-                )
-                r.draw_centered_text(
-                    draw,
-                    center_x,
-                    top_y + 35,
-                    Config.GREETING_TEXT,
-                    font=r.font_m,
-                    fill=r.COLOR_BLACK,
-                    align_y_center=False,
-                )
-
-            case "custom":
-                r.draw_centered_text(
-                    draw,
-                    center_x,
-                    top_y,
-                    item_data["label"],
-                    font=r.font_s,
-                    fill=r.COLOR_BLACK,
-                    align_y_center=False,
-                )
-                r.draw_centered_text(
-                    draw,
-                    center_x,
-                    top_y + 35,
-                    item_data["value"],
-                    font=r.font_value,
-                    fill=r.COLOR_BLACK,
-                    align_y_center=False,
-                )
+        # "Updated" label is part of the static layer (see draw_static). The
+        # value changes every minute, so it is assembled from cached glyphs
+        r.draw_centered_atlas_text(
+            draw,
+            center_x,
+            top_y + 35,
+            payload,
+            font=r.font_m,
+            fill=r.COLOR_BLACK,
+            align_y_center=False,
+        )
+
+    def _draw_greeting_item(
+        self, draw: ImageDraw.ImageDraw, center_x: int, top_y: int, payload: Any
+    ) -> None:
+        """Draw the configured greeting label and text."""
+        r = self.renderer
+        r.draw_centered_cached_text(
+            draw,
+            center_x,
+            top_y,
+            Config.GREETING_LABEL,
+            font=r.font_m,
+            fill=r.COLOR_BLACK,
+            align_y_center=False,
+        )
+        r.draw_centered_cached_text(
+            draw,
+            center_x,
+            top_y + 35,
+            Config.GREETING_TEXT,
+            font=r.font_m,
+            fill=r.COLOR_BLACK,
+            align_y_center=False,
+        )
+
+    def _draw_custom_item(
+        self, draw: ImageDraw.ImageDraw, center_x: int, top_y: int, payload: Any
+    ) -> None:
+        """Draw a custom (label, value) item."""
+        r = self.renderer
+        label, value = payload
+        r.draw_centered_text(
+            draw,
+            center_x,
+            top_y,
+            label,
+            font=r.font_s,
+            fill=r.COLOR_BLACK,
+            align_y_center=False,
+        )
+        r.draw_centered_text(
+            draw,
+            center_x,
+            top_y + 35,
+            value,
+            font=r.font_value,
+            fill=r.COLOR_BLACK,
+            align_y_center=False,
+        )
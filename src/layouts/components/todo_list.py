@@ -1,22 +1,35 @@
 """Todo list component for dashboard layout."""
 
+import functools
 import logging
+import math
 
-from PIL import ImageDraw
+from PIL import Image, ImageDraw
 
 from ...config import Config
 from ...renderer.dashboard import DashboardRenderer
-from ..utils.layout_helper import LayoutConstants, LayoutHelper
+from ..utils.layout_helper import LayoutConstants, get_layout_helper
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=8)
+def _limit_items(items: tuple[str, ...], max_lines: int) -> tuple[str, ...]:
+    """Cut items to max_lines, replacing the last kept one with an ellipsis."""
+    if len(items) <= max_lines:
+        return items
+    return items[: max_lines - 1] + ("...",)
+
+
 class TodoListComponent:
     """Handles rendering of the Todo list section."""
 
+    # Column headers, matching COLS
+    HEADERS = ("Goals", "Must", "Optional")
+
     def __init__(self, renderer: DashboardRenderer):
         self.renderer = renderer
-        self.layout = LayoutHelper(use_grayscale=Config.hardware.use_grayscale)
+        self.layout = get_layout_helper(Config.hardware.use_grayscale)
         self.LIST_HEADER_Y = 115
         self.LIST_START_Y = 155
         self.LINE_H = 40
@@ -30,6 +43,15 @@ class TodoListComponent:
             {"x": 560, "max_w": 220},  # Optional
         ]
 
+        # Horizontal slack around each column mask for glyph overhang
+        self.COL_PAD_X = 4
+
+        # Rendered column masks: col_idx -> ((image_mode, items), mask)
+        self._col_cache: dict[int, tuple[tuple[str, tuple[str, ...]], Image.Image]] = {}
+
+        # Column headers come from a fixed set; measure and rasterize them up front
+        renderer.warm_up_text([renderer.font_m], list(self.HEADERS))
+
     def draw(
         self,
         draw: ImageDraw.ImageDraw,
@@ -45,50 +67,69 @@ class TodoListComponent:
             must: List of must-do items
             optional: List of optional items
         """
-        r = self.renderer
-
         # Use Config defaults if not provided
         goals = goals or Config.LIST_GOALS
         must = must or Config.LIST_MUST
         optional = optional or Config.LIST_OPTIONAL
 
-        # Draw column headers
-        headers = ["Goals", "Must", "Optional"]
-        for i, header in enumerate(headers):
-            r.draw_truncated_text(
-                draw,
-                self.COLS[i]["x"],
-                self.LIST_HEADER_Y,
-                header,
-                r.font_m,
-                self.COLS[i]["max_w"],
-            )
-
         # Process data: truncate lines
-        safe_goals = self._limit_list_items(goals, self.MAX_LIST_LINES)
-        safe_must = self._limit_list_items(must, self.MAX_LIST_LINES)
-        safe_optional = self._limit_list_items(optional, self.MAX_LIST_LINES)
+        columns = (
+            self._limit_list_items(goals, self.MAX_LIST_LINES),
+            self._limit_list_items(must, self.MAX_LIST_LINES),
+            self._limit_list_items(optional, self.MAX_LIST_LINES),
+        )
 
-        # Draw content
-        self._draw_column(draw, 0, safe_goals)
-        self._draw_column(draw, 1, safe_must)
-        self._draw_column(draw, 2, safe_optional)
+        # Draw content: reuse the rendered mask of every column whose items did
+        # not change and only rasterize the changed ones
+        mode = draw._image.mode
+        col_cache = self._col_cache
+        pad_x = self.COL_PAD_X
+        start_y = self.LIST_START_Y
+        bitmap = draw.bitmap
+        for col_idx, (col, items) in enumerate(zip(self.COLS, columns, strict=True)):
+            key = (mode, items)
+            cached = col_cache.get(col_idx)
+            if cached is None or cached[0] != key:
+                cached = (key, self._render_column(mode, col["max_w"], items))
+                col_cache[col_idx] = cached
+            bitmap((col["x"] - pad_x, start_y), cached[1], fill=0)
+
+    def draw_static(self, draw: ImageDraw.ImageDraw, width: int) -> None:
+        """Draw column headers and the bottom divider (unchanged between frames).
+
+        Args:
+            draw: PIL ImageDraw object
+            width: Canvas width
+        """
+        r = self.renderer
+
+        # Draw column headers from cached glyph sprites
+        for col, header in zip(self.COLS, self.HEADERS, strict=True):
+            text = r.fit_text(header, r.font_m, col["max_w"], draw.fontmode)
+            if text is not None:
+                r.draw_cached_text(draw, col["x"], self.LIST_HEADER_Y, text, r.font_m)
 
         # Draw divider line using LayoutHelper
         self.layout.draw_horizontal_divider(
             draw,
             self.LINE_BOTTOM_Y,
-            width=draw.im.size[0],
+            width=width,
             line_width=LayoutConstants.LINE_NORMAL,
         )
 
-    def _draw_column(self, draw: ImageDraw.ImageDraw, col_idx: int, items: list[str]) -> None:
-        """Draw a single column of items."""
+    def _render_column(self, mode: str, max_w: int, items: tuple[str, ...]) -> Image.Image:
+        """Render one column of items into a mask (ink = 255) for compositing."""
         r = self.renderer
-        col = self.COLS[col_idx]
+        font_s = r.font_s
+        draw_truncated_text = r.draw_truncated_text
+        line_h = self.LINE_H
+        x = self.COL_PAD_X
+
+        mask = Image.new(mode, (max_w + 2 * x, self.MAX_LIST_LINES * line_h), 0)
+        draw = ImageDraw.Draw(mask)
 
         for i, text in enumerate(items):
-            y = self.LIST_START_Y + i * self.LINE_H
+            y = i * line_h
 
             # Check if item is completed (marked with ✓)
             is_completed = text.startswith("✓")
@@ -98,18 +139,13 @@ class TodoListComponent:
             display_text = text if text == "..." else f"• {text}"
 
             # Draw text and get bounding box
-            bbox = r.draw_truncated_text(
-                draw,
-                col["x"],
-                y,
-                display_text,
-                r.font_s,
-                col["max_w"],
-            )
+            bbox = draw_truncated_text(draw, x, y, display_text, font_s, max_w, fill=255)
 
             # Draw strikethrough if completed (skip bullet point)
             if is_completed and bbox:
-                self._draw_strikethrough(draw, col["x"], y, bbox, display_text)
+                self._draw_strikethrough(draw, x, y, bbox, display_text, fill=255)
+
+        return mask
 
     def _draw_strikethrough(
         self,
@@ -118,6 +154,7 @@ class TodoListComponent:
         y: int,
         bbox: tuple[float, float, float, float],
         display_text: str,
+        fill: int = 0,
     ) -> None:
         """Draw strikethrough line over completed text, skipping bullet point.
 
@@ -127,6 +164,7 @@ class TodoListComponent:
             y: Text baseline y position
             bbox: Text bounding box (x1, y1, x2, y2)
             display_text: The full display text (e.g., "• Item")
+            fill: Line color
         """
         # Calculate strikethrough position (middle of text height)
         text_height = bbox[3] - bbox[1]
@@ -135,17 +173,25 @@ class TodoListComponent:
         # Calculate bullet point width to skip it
         # If text starts with "• ", skip the bullet and space
         if display_text.startswith("• "):
-            bullet_width = draw.textlength("• ", font=self.renderer.font_s)
+            bullet_width = self.renderer.measure_width("• ", self.renderer.font_s, draw.fontmode)
             line_x1 = x + bullet_width
         else:
             line_x1 = x
 
-        # Draw strikethrough line (only over the text, not the bullet)
+        # Draw strikethrough line (only over the text, not the bullet). For an
+        # integer row and end point, a 2px horizontal line rasterizes to exactly
+        # this rectangle, so fill it directly instead of going through draw.line
         line_x2 = bbox[2]
-        draw.line([(line_x1, line_y), (line_x2, line_y)], fill=0, width=2)
+        if isinstance(line_y, int) and isinstance(line_x2, int) and line_x2 > line_x1 >= 0:
+            draw._image.paste(fill, (math.floor(line_x1), line_y, line_x2 + 1, line_y + 2))
+        else:
+            draw.line([(line_x1, line_y), (line_x2, line_y)], fill=fill, width=2)
 
-    def _limit_list_items(self, src_list: list[str], max_lines: int) -> list[str]:
-        """Limit list items and add ellipsis if truncated."""
-        if len(src_list) > max_lines:
-            return src_list[: max_lines - 1] + ["..."]
-        return src_list
+    @staticmethod
+    def _limit_list_items(src_list: list[str], max_lines: int) -> tuple[str, ...]:
+        """Limit list items and add ellipsis if truncated.
+
+        Results are memoized, so unchanged lists return the same tuple object
+        every frame (and double as column cache keys).
+        """
+        return _limit_items(tuple(src_list), max_lines)
@@ -1,20 +1,29 @@
 """Year-end summary component for dashboard layout."""
 
 import datetime
+import functools
+import itertools
 import logging
 from typing import Any
 
-from PIL import ImageDraw
+from PIL import Image, ImageDraw, ImageOps
 
 from src.config import BASE_DIR
 
 from ...renderer.dashboard import DashboardRenderer
 from ...renderer.icons.holiday import HolidayIcons
-from ..utils.layout_helper import LayoutHelper
+from ..utils.layout_helper import get_layout_helper
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=4)
+def _stats_x_positions(width: int, count: int) -> tuple[int, ...]:
+    """Spread count statistics evenly across the canvas width."""
+    spacing = width // (count + 1)
+    return tuple(spacing * (i + 1) for i in range(count))
+
+
 class YearEndSummaryComponent:
     """Handles rendering of the year-end summary screen."""
 
@@ -48,24 +57,50 @@ class YearEndSummaryComponent:
     ICONS_LANGUAGES = f"{BASE_DIR}/resources/icons/languages"
     ICONS_OCTICONS = f"{BASE_DIR}/resources/icons/octicons"
 
-    # Language icon mapping
+    # Decorative icons beside the title and bottom message
+    ICON_SATELLITE = f"{ICONS_HOLIDAYS}/satellite.png"
+    ICON_ASTRONAUT = f"{ICONS_HOLIDAYS}/astronaut.png"
+    ICON_STARSHIP = f"{ICONS_HOLIDAYS}/starship.png"
+    ICON_RADAR = f"{ICONS_HOLIDAYS}/radar.png"
+
+    # Language -> icon path
     LANG_ICONS = {
-        "Python": "Python.png",
-        "Go": "Go.png",
-        "Java": "Java.png",
-        "Rust": "Rust.png",
-        "PHP": "PHP.png",
-        "TypeScript": "TypeScript.png",
-        "JavaScript": "JavaScript.png",
+        "Python": f"{ICONS_LANGUAGES}/Python.png",
+        "Go": f"{ICONS_LANGUAGES}/Go.png",
+        "Java": f"{ICONS_LANGUAGES}/Java.png",
+        "Rust": f"{ICONS_LANGUAGES}/Rust.png",
+        "PHP": f"{ICONS_LANGUAGES}/PHP.png",
+        "TypeScript": f"{ICONS_LANGUAGES}/TypeScript.png",
+        "JavaScript": f"{ICONS_LANGUAGES}/JavaScript.png",
     }
 
+    # Statistics row: (data key, default value, icon path)
+    STATS_FIELDS = (
+        ("total_issues", 0, f"{ICONS_OCTICONS}/issue-opened.png"),
+        ("total_prs", 0, f"{ICONS_OCTICONS}/git-pull-request.png"),
+        ("total_stars", 0, f"{ICONS_OCTICONS}/star.png"),
+        ("total_commits", 0, f"{ICONS_OCTICONS}/git-commit.png"),
+        ("longest_streak", 0, f"{ICONS_OCTICONS}/flame.png"),
+        ("total_reviews", 0, f"{ICONS_OCTICONS}/code-review.png"),
+        ("most_productive_day", "N/A", f"{ICONS_OCTICONS}/pulse.png"),
+    )
+
     def __init__(self, renderer: DashboardRenderer):
         self.renderer = renderer
-        self.layout = LayoutHelper(use_grayscale=False)
+        self.layout = get_layout_helper(False)
         self.icons = HolidayIcons()
 
+        # Title and bottom message for the last (mode, width, height, year),
+        # as (key, offset, ink mask); they do not depend on the summary data
+        self._static_layer: tuple[tuple, tuple[int, int], Image.Image | None] | None = None
+
     def draw(
-        self, draw: ImageDraw.ImageDraw, width: int, height: int, summary_data: dict[str, Any]
+        self,
+        draw: ImageDraw.ImageDraw,
+        width: int,
+        height: int,
+        summary_data: dict[str, Any],
+        now: datetime.datetime | None = None,
     ) -> None:
         """Draw year-end summary (displayed on Dec 31st).
 
@@ -74,16 +109,50 @@ class YearEndSummaryComponent:
             width: Canvas width
             height: Canvas height
             summary_data: Year-end summary statistics
+            now: Current datetime, if the caller already has it
         """
-        year = datetime.datetime.now().year
-        center_x = width // 2
+        year = (now or datetime.datetime.now()).year
 
-        # Draw all sections
-        self._draw_title(draw, center_x, year)
+        # Title and bottom message (with their icons) come from a cached layer
+        key = (draw._image.mode, width, height, year)
+        if self._static_layer is None or self._static_layer[0] != key:
+            self._static_layer = (key, *self._render_static_layer(key))
+        _, offset, mask = self._static_layer
+        if mask is not None:
+            draw.bitmap(offset, mask, fill=0)
+
+        # Draw the data-dependent sections
         self._draw_contributions(draw, summary_data)
         self._draw_languages(draw, summary_data)
         self._draw_statistics(draw, width, summary_data)
-        self._draw_bottom_message(draw, center_x, width, height, year)
+
+    def _render_static_layer(
+        self, key: tuple[str, int, int, int]
+    ) -> tuple[tuple[int, int], Image.Image | None]:
+        """Render the title and bottom message into an ink mask (ink = 255).
+
+        Args:
+            key: (image mode, width, height, year) of the target canvas
+
+        Returns:
+            Top-left offset of the mask and the mask cropped to its ink, or
+            None if nothing was drawn
+        """
+        mode, width, height, year = key
+        center_x = width // 2
+
+        # Draw on white in the canvas mode so text and icons rasterize exactly
+        # as they would on the canvas, then invert into a mask
+        layer = Image.new(mode, (width, height), 255)
+        layer_draw = ImageDraw.Draw(layer)
+        self._draw_title(layer_draw, center_x, year)
+        self._draw_bottom_message(layer_draw, center_x, width, height, year)
+
+        mask = ImageOps.invert(layer.convert("L"))
+        bbox = mask.getbbox()
+        if bbox is None:
+            return (0, 0), None
+        return bbox[:2], mask.crop(bbox)
 
     def _draw_title(self, draw: ImageDraw.ImageDraw, center_x: int, year: int) -> None:
         """Draw title with decorative icons."""
@@ -97,7 +166,7 @@ class YearEndSummaryComponent:
             draw,
             center_x - self.TITLE_ICON_OFFSET,
             self.TITLE_Y,
-            f"{self.ICONS_HOLIDAYS}/satellite.png",
+            self.ICON_SATELLITE,
             size=self.TITLE_ICON_SIZE,
         )
 
@@ -106,7 +175,7 @@ class YearEndSummaryComponent:
             draw,
             center_x + self.TITLE_ICON_OFFSET,
             self.TITLE_Y,
-            f"{self.ICONS_HOLIDAYS}/astronaut.png",
+            self.ICON_ASTRONAUT,
             size=self.TITLE_ICON_SIZE,
         )
 
@@ -137,53 +206,45 @@ class YearEndSummaryComponent:
             draw, self.LANG_LABEL_X, self.LANG_Y, "Top 3 Languages", font=self.renderer.font_m
         )
 
-        # Draw language icons
-        for i, lang in enumerate(top_languages):
-            icon_name = self.LANG_ICONS.get(lang)
-            if not icon_name:
+        # Draw language icons (an unknown language leaves its slot empty)
+        lang_xs = itertools.count(self.LANG_ICONS_START_X, self.LANG_ICON_SPACING)
+        for x, lang in zip(lang_xs, top_languages, strict=False):
+            icon_path = self.LANG_ICONS.get(lang)
+            if not icon_path:
                 continue
 
-            x = self.LANG_ICONS_START_X + (i * self.LANG_ICON_SPACING)
             self.icons.draw_image_icon(
                 draw,
                 x,
                 self.LANG_Y + self.LANG_ICON_Y_OFFSET,
-                f"{self.ICONS_LANGUAGES}/{icon_name}",
+                icon_path,
                 size=self.LANG_ICON_SIZE,
             )
 
     def _draw_statistics(self, draw: ImageDraw.ImageDraw, width: int, data: dict[str, Any]) -> None:
         """Draw bottom statistics row with icons."""
-        stats_config = [
-            (data.get("total_issues", 0), "issue-opened.png"),
-            (data.get("total_prs", 0), "git-pull-request.png"),
-            (data.get("total_stars", 0), "star.png"),
-            (data.get("total_commits", 0), "git-commit.png"),
-            (data.get("longest_streak", 0), "flame.png"),
-            (data.get("total_reviews", 0), "code-review.png"),
-            (data.get("most_productive_day", "N/A"), "pulse.png"),
-        ]
-
-        num_stats = len(stats_config)
-        stat_spacing = width // (num_stats + 1)
+        r = self.renderer
         stats_icon_y = self.STATS_Y + self.STATS_ICON_Y_OFFSET
+        xs = _stats_x_positions(width, len(self.STATS_FIELDS))
 
-        for i, (value, icon_file) in enumerate(stats_config):
-            x = stat_spacing * (i + 1)
+        # Stringify values and pick their fonts up front (short values use the
+        # larger font), so the drawing loop has no per-item branching
+        values = [data.get(key, default) for key, default, _ in self.STATS_FIELDS]
+        value_strs = [value if isinstance(value, str) else str(value) for value in values]
+        fonts = [r.font_m if len(value_str) <= 3 else r.font_s for value_str in value_strs]
 
+        for x, value_str, font, (_, _, icon_path) in zip(
+            xs, value_strs, fonts, self.STATS_FIELDS, strict=True
+        ):
             # Draw value
-            value_str = str(value) if not isinstance(value, str) else value
-            font = self.renderer.font_m if len(value_str) <= 3 else self.renderer.font_s
-            self.renderer.draw_centered_text(
-                draw, x, self.STATS_Y, value_str, font=font, align_y_center=True
-            )
+            r.draw_centered_text(draw, x, self.STATS_Y, value_str, font=font, align_y_center=True)
 
             # Draw icon
             self.icons.draw_image_icon(
                 draw,
                 x,
                 stats_icon_y,
-                f"{self.ICONS_OCTICONS}/{icon_file}",
+                icon_path,
                 size=self.STATS_ICON_SIZE,
             )
 
@@ -203,7 +264,7 @@ class YearEndSummaryComponent:
             draw,
             center_x - self.BOTTOM_ICON_OFFSET,
             bottom_y,
-            f"{self.ICONS_HOLIDAYS}/starship.png",
+            self.ICON_STARSHIP,
             size=self.BOTTOM_ICON_SIZE,
         )
 
@@ -212,7 +273,7 @@ class YearEndSummaryComponent:
             draw,
             center_x + self.BOTTOM_ICON_OFFSET,
             bottom_y,
-            f"{self.ICONS_HOLIDAYS}/radar.png",
+            self.ICON_RADAR,
             size=self.BOTTOM_ICON_SIZE,
             flip_horizontal=True,
         )
@@ -5,6 +5,7 @@ including weather, date, time, GitHub stats, and custom widgets.
 """
 
 import datetime
+import functools
 import logging
 
 from PIL import Image, ImageDraw
@@ -20,6 +21,19 @@ from .components.year_end import YearEndSummaryComponent
 logger = logging.getLogger(__name__)
 
 
+def _snapshot(value):
+    """Freeze nested dicts and lists into comparable tuples.
+
+    Frame signatures keep snapshots instead of references to the caller's
+    data, so a provider mutating a dict in place still changes the signature.
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((key, _snapshot(item)) for key, item in value.items()))
+    if isinstance(value, list | tuple):
+        return tuple(_snapshot(item) for item in value)
+    return value
+
+
 class DashboardLayout:
     """Manages the layout and rendering of dashboard components.
 
@@ -27,6 +41,9 @@ class DashboardLayout:
     Supports both normal dashboard mode and special holiday greeting screens.
     """
 
+    # Released frames kept for reuse as canvases (see release)
+    CANVAS_POOL_SIZE = 2
+
     def __init__(self):
         self.renderer = DashboardRenderer()
 
@@ -43,6 +60,30 @@ class DashboardLayout:
         self._current_must = Config.LIST_MUST
         self._current_optional = Config.LIST_OPTIONAL
 
+        # Static background layers keyed by (width, height, image_mode, show_hackernews)
+        self._static_bg_cache: dict[tuple[int, int, str, bool], Image.Image] = {}
+
+        # Last rendered frame, reused when the inputs have not changed
+        self._last_frame_sig: tuple | None = None
+        self._last_image: Image.Image | None = None
+
+        # Per-section inputs of the last frame (header, middle, footer), used to
+        # derive the dirty region hint for partial display updates
+        self._last_sig_parts: tuple[tuple, tuple, tuple] | None = None
+
+        # (x0, y0, x1, y1) region where the frame last returned by create_image
+        # differs from the one before it, or None when nothing changed
+        self.last_dirty_bbox: tuple[int, int, int, int] | None = None
+
+        # Last holiday greeting screen as (key, image); it is fixed for the day
+        self._holiday_cache: tuple[tuple, Image.Image] | None = None
+
+        # Last year-end summary screen as (key, image)
+        self._year_end_cache: tuple[tuple, Image.Image] | None = None
+
+        # Canvases handed back through release(), reused instead of allocating
+        self._canvas_pool: list[Image.Image] = []
+
     def create_image(self, width, height, data):
         """Generate complete dashboard image.
 
@@ -52,12 +93,13 @@ class DashboardLayout:
             data: Dictionary containing all display data
 
         Returns:
-            PIL Image object (mode "L" for grayscale or "1" for B/W)
+            PIL Image object (mode "L" for grayscale or "1" for B/W). If the
+            inputs match the previous call, a copy of the previous frame is
+            returned without redrawing. ``last_dirty_bbox`` is updated to the
+            ``(x0, y0, x1, y1)`` region that differs from the previous frame,
+            or None when nothing changed.
         """
-        # Create canvas with appropriate mode
         image_mode = "L" if Config.hardware.use_grayscale else "1"
-        image = Image.new(image_mode, (width, height), 255)
-        draw = ImageDraw.Draw(image)
 
         # Extract data
         now = datetime.datetime.now()
@@ -78,27 +120,258 @@ class DashboardLayout:
             self._current_must = data.get("todo_must", Config.LIST_MUST)
             self._current_optional = data.get("todo_optional", Config.LIST_OPTIONAL)
 
+        # Skip rendering entirely when every input matches the previous frame
+        # (time is compared at minute resolution, matching what is displayed).
+        # A plain tuple compared with == short-circuits on the first mismatch and
+        # is cheaper than hashing; dict and list inputs are snapshotted as tuples.
+        middle = (
+            self._current_hackernews
+            if show_hackernews
+            else (self._current_goals, self._current_must, self._current_optional)
+        )
+        sig_parts = (
+            (
+                now.replace(second=0, microsecond=0),
+                _snapshot(weather),
+                Config.CITY_NAME,
+                Config.GREETING_LABEL,
+                Config.GREETING_TEXT,
+            ),
+            (show_hackernews, _snapshot(middle)),
+            (_snapshot(commits), vps_data, _snapshot(btc_data), week_prog),
+        )
+        frame_sig = (width, height, image_mode, sig_parts)
+        if frame_sig == self._last_frame_sig and self._last_image is not None:
+            logger.debug("Dashboard inputs unchanged, reusing previous frame")
+            self.last_dirty_bbox = None
+            return self._copy_to_canvas(self._last_image)
+
+        # A different canvas invalidates the whole previous frame
+        same_canvas = (
+            self._last_image is not None
+            and self._last_frame_sig is not None
+            and self._last_frame_sig[:3] == frame_sig[:3]
+        )
+        background = self._get_static_background(width, height, image_mode, show_hackernews)
+        if same_canvas:
+            # Start from the previous frame and only redraw the sections whose
+            # inputs changed, after restoring their band of the static layer
+            image = self._copy_to_canvas(self._last_image)
+            changed = tuple(
+                part != last_part
+                for part, last_part in zip(sig_parts, self._last_sig_parts, strict=True)
+            )
+            for (y0, y1), section_changed in zip(self._section_bands(height), changed, strict=True):
+                if section_changed:
+                    image.paste(background.crop((0, y0, width, y1)), (0, y0))
+        else:
+            # Start from a copy of the pre-rendered static layer (dividers, headers, labels)
+            image = self._copy_to_canvas(background)
+            changed = (True, True, True)
+        draw = ImageDraw.Draw(image)
+        header_changed, middle_changed, footer_changed = changed
+
         # Draw three main sections using components
-        self.header.draw(draw, width, now, weather)
+        if header_changed:
+            self.header.draw(draw, width, now, weather)
 
         # Draw middle section based on rotation
-        if show_hackernews:
-            self.hackernews.draw(draw, width, self._current_hackernews)
-        else:
-            self.todo_list.draw(
-                draw, self._current_goals, self._current_must, self._current_optional
+        if middle_changed:
+            if show_hackernews:
+                self.hackernews.draw(draw, width, self._current_hackernews)
+            else:
+                self.todo_list.draw(
+                    draw, self._current_goals, self._current_must, self._current_optional
+                )
+
+        if footer_changed:
+            self.footer.draw(draw, width, commits, vps_data, btc_data, week_prog)
+
+        self.last_dirty_bbox = self._get_dirty_bbox(
+            width, height, sig_parts, self._last_sig_parts if same_canvas else None
+        )
+
+        previous_image = self._last_image
+        self._last_frame_sig = frame_sig
+        self._last_sig_parts = sig_parts
+        self._last_image = image
+        if previous_image is not None:
+            self.release(previous_image)
+
+        return self._copy_to_canvas(image)
+
+    def release(self, image):
+        """Hand back a frame returned by create_image once it is no longer used.
+
+        The image buffer is recycled as the canvas of a later frame, so the
+        caller must not touch it afterwards.
+
+        Args:
+            image: PIL Image previously returned by create_image
+        """
+        if image is self._last_image or len(self._canvas_pool) >= self.CANVAS_POOL_SIZE:
+            return
+        if any(image is canvas for canvas in self._canvas_pool):
+            return
+        self._canvas_pool.append(image)
+
+    def _copy_to_canvas(self, source):
+        """Copy an image, reusing a released canvas of the same size and mode.
+
+        Args:
+            source: PIL Image to copy
+
+        Returns:
+            PIL Image with the same pixels as source
+        """
+        for i, canvas in enumerate(self._canvas_pool):
+            if canvas.size == source.size and canvas.mode == source.mode:
+                del self._canvas_pool[i]
+                canvas.paste(source)
+                canvas.info.clear()
+                return canvas
+        return source.copy()
+
+    def _get_dirty_bbox(self, width, height, sig_parts, last_sig_parts):
+        """Compute the region that changed since the previous frame.
+
+        Each section (header, middle, footer) has a fixed vertical band; the
+        result is the union of the bands whose inputs changed.
+
+        Args:
+            width: Image width in pixels
+            height: Image height in pixels
+            sig_parts: Per-section inputs of the current frame
+            last_sig_parts: Per-section inputs of the previous frame, or None if
+                there is no comparable previous frame
+
+        Returns:
+            (x0, y0, x1, y1) tuple, or None when no section changed
+        """
+        if last_sig_parts is None:
+            return (0, 0, width, height)
+
+        changed = [
+            band
+            for band, part, last_part in zip(
+                self._section_bands(height), sig_parts, last_sig_parts, strict=True
+            )
+            if part != last_part
+        ]
+        if not changed:
+            return None
+        return (0, min(b[0] for b in changed), width, max(b[1] for b in changed))
+
+    def _section_bands(self, height):
+        """Vertical (y0, y1) bands of the header, middle and footer sections.
+
+        Everything a section draws per frame stays inside its band, so a band
+        can be restored from the static layer and redrawn on its own.
+        """
+        return (
+            (0, self.header.LINE_TOP_Y),
+            (self.todo_list.LIST_HEADER_Y, self.todo_list.LINE_BOTTOM_Y),
+            (self.todo_list.LINE_BOTTOM_Y, height),
+        )
+
+    def _get_static_background(self, width, height, image_mode, show_hackernews):
+        """Return the cached layer of elements that never change between frames.
+
+        The layer holds divider lines, list column headers and fixed labels, so
+        each refresh only has to draw the data-dependent parts on top of a copy.
+
+        Args:
+            width: Image width in pixels
+            height: Image height in pixels
+            image_mode: PIL image mode ("L" or "1")
+            show_hackernews: Whether the middle section shows Hacker News
+
+        Returns:
+            Cached PIL Image; callers must copy it before drawing
+        """
+        key = (width, height, image_mode, show_hackernews)
+        background = self._static_bg_cache.get(key)
+        if background is None:
+            background = Image.new(image_mode, (width, height), 255)
+            draw = ImageDraw.Draw(background)
+            self.header.draw_static(draw, width)
+            if show_hackernews:
+                self.hackernews.draw_static(draw, width)
+            else:
+                self.todo_list.draw_static(draw, width)
+            self.footer.draw_static(draw, width)
+            self._static_bg_cache[key] = background
+        return background
+
+    def create_holiday_image(self, width, height, holiday):
+        """Generate the full-screen holiday greeting.
+
+        The greeting only depends on the holiday and canvas, so it is rendered
+        once and later calls return a copy.
+
+        Args:
+            width: Image width in pixels
+            height: Image height in pixels
+            holiday: Holiday dict with title, message and optional icon
+
+        Returns:
+            PIL Image object (mode "L" for grayscale or "1" for B/W)
+        """
+        image_mode = "L" if Config.hardware.use_grayscale else "1"
+        key = (width, height, image_mode, holiday["title"], holiday["message"], holiday.get("icon"))
+        if self._holiday_cache is None or self._holiday_cache[0] != key:
+            image = Image.new(image_mode, (width, height), 255)
+            self.renderer.draw_full_screen_message(
+                ImageDraw.Draw(image), width, height, key[3], key[4], key[5]
             )
+            self._holiday_cache = (key, image)
+        return self._holiday_cache[1].copy()
 
-        self.footer.draw(draw, width, commits, vps_data, btc_data, week_prog)
+    def create_year_end_image(self, width, height, summary_data):
+        """Generate the full-screen year-end summary.
 
-        return image
+        The summary changes at most a few times a day, so the screen is only
+        redrawn when the summary, year or canvas changes; other calls return a
+        copy of the previous one.
+
+        Args:
+            width: Image width in pixels
+            height: Image height in pixels
+            summary_data: Year-end summary statistics
+
+        Returns:
+            PIL Image object (mode "L" for grayscale or "1" for B/W)
+        """
+        image_mode = "L" if Config.hardware.use_grayscale else "1"
+        now = datetime.datetime.now()
+        key = (width, height, image_mode, now.year, summary_data)
+        if self._year_end_cache is None or self._year_end_cache[0] != key:
+            image = Image.new(image_mode, (width, height), 255)
+            self._draw_year_end_summary(ImageDraw.Draw(image), width, height, summary_data, now)
+            self._year_end_cache = (key, image)
+        return self._year_end_cache[1].copy()
 
     def _draw_hackernews(self, draw, width):
         """Legacy method for backward compatibility/external calls."""
-        # Some tasks might call this directly (e.g. hackernews task)
-        # We delegate to the component
+        # Some tasks might call this directly (e.g. hackernews task) on a blank
+        # canvas, so the static divider is drawn here as well
+        self.hackernews.draw_static(draw, width)
         self.hackernews.draw(draw, width, self._current_hackernews)
 
-    def _draw_year_end_summary(self, draw, width, height, summary_data):
+    def _draw_year_end_summary(self, draw, width, height, summary_data, now=None):
         """Draw year-end summary (displayed on Dec 31st)."""
-        self.year_end.draw(draw, width, height, summary_data)
+        self.year_end.draw(draw, width, height, summary_data, now)
+
+
+@functools.lru_cache(maxsize=1)
+def get_dashboard_layout() -> DashboardLayout:
+    """Get the process-wide DashboardLayout.
+
+    The layout keeps its rendered screens and static layers between calls, so
+    the main loop and the display modes share one instance instead of each
+    starting from empty caches.
+
+    Returns:
+        Shared DashboardLayout instance
+    """
+    return DashboardLayout()
@@ -12,7 +12,7 @@ from PIL import Image, ImageDraw, ImageFont
 
 from ..renderer.dashboard import DashboardRenderer
 from ..utils.fonts import FontManager
-from .utils.layout_helper import LayoutConstants, LayoutHelper
+from .utils.layout_helper import LayoutConstants, get_layout_helper
 
 logger = logging.getLogger(__name__)
 
@@ -23,7 +23,7 @@ class PoetryLayout:
     def __init__(self):
         """Initialize poetry layout with renderer."""
         self.renderer = DashboardRenderer()
-        self.layout = LayoutHelper(use_grayscale=False)
+        self.layout = get_layout_helper(False)
 
         # Resolve fonts using FontManager
         self.font_path = FontManager.get_font_path(
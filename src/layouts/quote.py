@@ -3,24 +3,64 @@
 Creates beautiful quote display with automatic text wrapping and decorative elements.
 """
 
+import functools
 import logging
 import textwrap
 
 from PIL import Image, ImageDraw
 
 from ..renderer.dashboard import DashboardRenderer
-from .utils.layout_helper import LayoutConstants, LayoutHelper
+from .utils.layout_helper import LayoutConstants, get_layout_helper
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=32)
+def _wrap_quote(text: str, chars_per_line: int) -> tuple[str, ...]:
+    """Wrap quote text into lines, cached since the quote changes at most daily."""
+    return tuple(
+        textwrap.wrap(
+            text,
+            width=chars_per_line,
+            break_long_words=False,
+            break_on_hyphens=False,
+        )
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _quote_background(width: int, height: int) -> Image.Image:
+    """Build the static quote frame (corner decorations) for a canvas size.
+
+    The returned image is shared; callers must copy it before drawing.
+    """
+    image = Image.new("1", (width, height), 1)  # White background
+    get_layout_helper(False).draw_corner_decorations(
+        ImageDraw.Draw(image),
+        width,
+        height,
+        corner_size=LayoutConstants.CORNER_SMALL,
+        margin=LayoutConstants.MARGIN_MEDIUM,
+        line_width=LayoutConstants.LINE_NORMAL,
+    )
+    return image
+
+
+@functools.lru_cache(maxsize=4)
+def _format_attribution(author: str, source: str) -> str:
+    """Build the attribution line shown under the quote."""
+    if source:
+        return f"— {author}, {source}"
+    return f"— {author}"
+
+
 class QuoteLayout:
     """Manages elegant quote layout for E-Ink display."""
 
     def __init__(self):
         """Initialize quote layout with renderer."""
         self.renderer = DashboardRenderer()
-        self.layout = LayoutHelper(use_grayscale=False)
+        self.layout = get_layout_helper(False)
 
     def create_quote_image(self, width: int, height: int, quote: dict) -> Image.Image:
         """Create elegant quote image with automatic text wrapping.
@@ -33,13 +73,13 @@ class QuoteLayout:
         Returns:
             PIL Image object ready for E-Ink display
         """
-        # Create canvas
-        image = Image.new("1", (width, height), 1)  # White background
-        draw = ImageDraw.Draw(image)
-
         if not quote:
             logger.warning("No quote data provided")
-            return image
+            return Image.new("1", (width, height), 1)  # White background
+
+        # Start from a copy of the cached frame with the corner decorations
+        image = _quote_background(width, height).copy()
+        draw = ImageDraw.Draw(image)
 
         content = quote.get("content", "")
         author = quote.get("author", "")
@@ -61,7 +101,7 @@ class QuoteLayout:
         line_spacing = 20
 
         # Dynamic font scaling loop
-        wrapped_lines = []
+        wrapped_lines: tuple[str, ...] = ()
         total_content_height = 0
 
         while quote_font_size >= min_font_size:
@@ -146,10 +186,7 @@ class QuoteLayout:
 
         # Draw author and source
         author_y = current_y + 40  # noqa: F821
-        if source:
-            author_text = f"— {author}, {source}"
-        else:
-            author_text = f"— {author}"
+        author_text = _format_attribution(author, source)
 
         # Calculate text width for right alignment
         try:
@@ -173,20 +210,10 @@ class QuoteLayout:
             draw, line_start_x, line_y, 200, orientation="horizontal", line_width=2
         )
 
-        # Draw subtle corner decorations using LayoutHelper
-        self.layout.draw_corner_decorations(
-            draw,
-            width,
-            height,
-            corner_size=LayoutConstants.CORNER_SMALL,
-            margin=LayoutConstants.MARGIN_MEDIUM,
-            line_width=LayoutConstants.LINE_NORMAL,
-        )
-
         logger.info(f"Created quote layout: {author} (font size: {quote_font_size})")
         return image
 
-    def _wrap_text(self, text: str, font_size: int, max_width: int) -> list[str]:
+    def _wrap_text(self, text: str, font_size: int, max_width: int) -> tuple[str, ...]:
         """Wrap text to fit within max width.
 
         Args:
@@ -195,7 +222,7 @@ class QuoteLayout:
             max_width: Maximum width in pixels
 
         Returns:
-            List of wrapped lines
+            Tuple of wrapped lines (memoized, so callers must not modify it)
         """
         # Estimate characters per line based on font size
         # This is approximate - actual width depends on font and characters
@@ -203,14 +230,7 @@ class QuoteLayout:
         chars_per_line = int(max_width / avg_char_width)
 
         # Use textwrap for intelligent line breaking
-        wrapped = textwrap.wrap(
-            text,
-            width=chars_per_line,
-            break_long_words=False,
-            break_on_hyphens=False,
-        )
-
-        return wrapped
+        return _wrap_quote(text, chars_per_line)
 
 
 # Suppress false positive lint warnings - all variables are actually used
@@ -4,6 +4,7 @@ Provides standardized constants, column layout utilities, divider drawing method
 and decorative element tools to eliminate code duplication.
 """
 
+import functools
 import logging
 
 from PIL import ImageDraw
@@ -98,6 +99,13 @@ class ColumnLayout:
         return int(self.padding_left + ((col_index + 1) * self.col_width))
 
 
+@functools.lru_cache(maxsize=32)
+def _column_centers(width: int, num_cols: int, padding: int | tuple[int, int]) -> tuple[int, ...]:
+    """Compute (and memoize) the center x-coordinate of every column."""
+    col_layout = ColumnLayout(width, num_cols, padding)
+    return tuple(col_layout.get_column_center(i) for i in range(num_cols))
+
+
 class GridLayout:
     """Helper class for grid-based layouts."""
 
@@ -409,6 +417,27 @@ class LayoutHelper:
         """
         return ColumnLayout(width, num_cols, padding)
 
+    def get_column_centers(
+        self,
+        width: int,
+        num_cols: int,
+        padding: int | tuple[int, int] = LayoutConstants.MARGIN_SMALL,
+    ) -> tuple[int, ...]:
+        """Get the center x-coordinates of all columns.
+
+        Results are memoized per (width, num_cols, padding), so fixed-geometry
+        layouts avoid recomputing the same float math on every refresh.
+
+        Args:
+            width: Total width available
+            num_cols: Number of columns
+            padding: Padding on edges (int or (left, right) tuple)
+
+        Returns:
+            Tuple of column center x-coordinates
+        """
+        return _column_centers(width, num_cols, padding)
+
     def create_grid_layout(
         self,
         width: int,
@@ -432,3 +461,19 @@ class LayoutHelper:
             GridLayout instance
         """
         return GridLayout(width, height, rows, cols, margin_x, margin_y)
+
+
+@functools.lru_cache(maxsize=2)
+def get_layout_helper(use_grayscale: bool = False) -> LayoutHelper:
+    """Get the shared LayoutHelper for a color mode.
+
+    LayoutHelper holds no per-layout state, so all components and layouts
+    using the same color mode share one instance.
+
+    Args:
+        use_grayscale: Whether to use grayscale colors
+
+    Returns:
+        Shared LayoutHelper instance
+    """
+    return LayoutHelper(use_grayscale=use_grayscale)
@@ -23,7 +23,7 @@ try:
     )
     from .core.data_fetcher import DataFetcher
     from .drivers.factory import get_driver
-    from .layouts import DashboardLayout
+    from .layouts import get_dashboard_layout
     from .providers import Dashboard
     from .providers.hackernews import get_hackernews
     from .renderer.image_builder import ImageBuilder
@@ -40,7 +40,7 @@ except ImportError:
     )
     from src.core.data_fetcher import DataFetcher
     from src.drivers.factory import get_driver
-    from src.layouts import DashboardLayout
+    from src.layouts import get_dashboard_layout
     from src.providers import Dashboard
     from src.providers.hackernews import get_hackernews
     from src.renderer.image_builder import ImageBuilder
@@ -208,7 +208,7 @@ async def main():
     # Initialize components
     epd = get_driver()
     _driver = epd  # For signal handler
-    layout = DashboardLayout()
+    layout = get_dashboard_layout()
     controller = DisplayController()
     quiet = QuietHours(
         Config.hardware.quiet_start_hour, Config.hardware.quiet_end_hour, Config.hardware.timezone
@@ -280,6 +280,8 @@ async def main():
 
                 # Update display
                 await update_display(epd, image, config_changed)
+                if mode == "dashboard":
+                    layout.release(image)
 
                 # Wait for next refresh
                 interval = controller.get_refresh_interval(mode)
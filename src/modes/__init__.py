@@ -6,7 +6,7 @@ These can serve as templates for creating new display modes.
 
 import httpx
 import pendulum
-from PIL import Image, ImageDraw
+from PIL import Image
 
 from src.config import Config
 from src.core.display_mode import DisplayMode, register_mode
@@ -45,18 +45,10 @@ class HolidayMode(DisplayMode):
 
     def render(self, width: int, height: int, data: dict) -> Image.Image:
         """Render holiday greeting."""
-        from src.layouts import DashboardLayout
+        from src.layouts import get_dashboard_layout
 
-        holiday = data["holiday"]
-        image_mode = "L" if Config.hardware.use_grayscale else "1"
-        image = Image.new(image_mode, (width, height), 255)
-        draw = ImageDraw.Draw(image)
-
-        layout = DashboardLayout()
-        layout.renderer.draw_full_screen_message(
-            draw, width, height, holiday["title"], holiday["message"], holiday.get("icon")
-        )
-        return image
+        layout = get_dashboard_layout()
+        return layout.create_holiday_image(width, height, data["holiday"])
 
 
 @register_mode
@@ -88,15 +80,10 @@ class YearEndMode(DisplayMode):
 
     def render(self, width: int, height: int, data: dict) -> Image.Image:
         """Render year-end summary."""
-        from src.layouts import DashboardLayout
-
-        image_mode = "L" if Config.hardware.use_grayscale else "1"
-        image = Image.new(image_mode, (width, height), 255)
-        draw = ImageDraw.Draw(image)
+        from src.layouts import get_dashboard_layout
 
-        layout = DashboardLayout()
-        layout._draw_year_end_summary(draw, width, height, data["github_year_summary"])
-        return image
+        layout = get_dashboard_layout()
+        return layout.create_year_end_image(width, height, data["github_year_summary"])
 
 
 @register_mode
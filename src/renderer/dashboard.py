@@ -85,6 +85,35 @@ class DashboardRenderer:
         """Draw centered text (delegates to TextRenderer)."""
         self.text.draw_centered_text(draw, x, y, text, font, fill, align_y_center)
 
+    def draw_cached_text(self, draw, x, y, text, font, fill=0):
+        """Draw text from a cached glyph sprite (delegates to TextRenderer)."""
+        self.text.draw_cached_text(draw, x, y, text, font, fill)
+
+    def draw_centered_cached_text(self, draw, x, y, text, font, fill=0, align_y_center=True):
+        """Draw centered text from a cached glyph sprite (delegates to TextRenderer)."""
+        self.text.draw_centered_cached_text(draw, x, y, text, font, fill, align_y_center)
+
+    def draw_centered_atlas_text(self, draw, x, y, text, font, fill=0, align_y_center=True):
+        """Draw centered text from pre-rasterized glyphs (delegates to TextRenderer)."""
+        self.text.draw_centered_atlas_text(draw, x, y, text, font, fill, align_y_center)
+
+    def get_text_bbox(self, text, font):
+        """Get memoized text bounding box (delegates to TextRenderer)."""
+        return self.text.get_text_bbox(text, font)
+
+    def measure_width(self, text, font, mode="L"):
+        """Get memoized text advance width (delegates to TextRenderer)."""
+        return self.text.measure_width(text, font, mode)
+
+    def warm_up_text(self, fonts, labels):
+        """Pre-measure and rasterize known labels (delegates to TextRenderer)."""
+        fontmode = "L" if Config.hardware.use_grayscale else "1"
+        self.text.warm_up(fonts, labels, fontmode)
+
+    def fit_text(self, text, font, max_width, mode="L"):
+        """Get memoized truncated text (delegates to TextRenderer)."""
+        return self.text.fit_text(text, font, max_width, mode)
+
     def draw_truncated_text(self, draw, x, y, text, font, max_width, fill=0):
         """Draw truncated text (delegates to TextRenderer)."""
         return self.text.draw_truncated_text(draw, x, y, text, font, max_width, fill)
@@ -3,11 +3,78 @@
 Provides holiday-themed icon drawing functions.
 """
 
+import functools
 import math
+from pathlib import Path
 
 from src.config import BASE_DIR
 
 
+@functools.lru_cache(maxsize=32)
+def _load_image_icon(icon_path: str, size: int, flip_horizontal: bool, mode: str = "1"):
+    """Decode and threshold a PNG icon once per (path, size, flip, canvas mode).
+
+    The 1-bit result is stored converted to the canvas mode, so pasting it
+    needs no per-call mode conversion.
+
+    Returns:
+        PIL Image in the given mode, or None if the file does not exist
+    """
+    from PIL import Image, ImageEnhance, ImageFilter, ImageOps
+
+    if not Path(icon_path).exists():
+        return None
+
+    # Load the image
+    icon_img = Image.open(icon_path)
+
+    # Ensure RGBA for consistent handling
+    icon_img = icon_img.convert("RGBA")
+
+    # Flip horizontally if requested
+    if flip_horizontal:
+        icon_img = icon_img.transpose(Image.FLIP_LEFT_RIGHT)
+
+    # Resize to target size while maintaining aspect ratio
+    icon_img.thumbnail((size, size), Image.Resampling.LANCZOS)
+
+    # Create a white background
+    background = Image.new("RGBA", icon_img.size, (255, 255, 255, 255))
+
+    # Paste the image on white background using alpha channel as mask
+    background = Image.alpha_composite(background, icon_img)
+
+    # Convert to grayscale
+    gray_img = background.convert("L")
+
+    # Check if background is dark (check 4 corners)
+    w, h = gray_img.size
+    corners = [
+        gray_img.getpixel((0, 0)),
+        gray_img.getpixel((w - 1, 0)),
+        gray_img.getpixel((0, h - 1)),
+        gray_img.getpixel((w - 1, h - 1)),
+    ]
+    avg_bg = sum(corners) / 4
+
+    # If background is dark (< 200), invert the image to make it dark-on-light
+    # This handles cases where the icon is light-colored on a dark background
+    if avg_bg < 200:
+        gray_img = ImageOps.invert(gray_img)
+
+    # Enhance contrast for sharper edges
+    enhancer = ImageEnhance.Contrast(gray_img)
+    icon_img = enhancer.enhance(2.0)
+
+    # Apply sharpening filter
+    icon_img = icon_img.filter(ImageFilter.SHARPEN)
+
+    # Convert to 1-bit using threshold
+    # Threshold at 128 (middle value)
+    icon_img = icon_img.point(lambda x: 0 if x < 128 else 255, "1")
+    return icon_img if mode == "1" else icon_img.convert(mode)
+
+
 class HolidayIcons:
     """Handles holiday icon rendering."""
 
@@ -90,6 +157,9 @@ class HolidayIcons:
     def draw_image_icon(self, draw, x, y, image_path, size=80, flip_horizontal=False):
         """Draw an icon from a PNG image file.
 
+        The converted icon is cached per (path, size, flip, canvas mode), so
+        redraws only paste it.
+
         Args:
             draw: PIL ImageDraw object
             x: Center x coordinate
@@ -98,64 +168,14 @@ class HolidayIcons:
             size: Target size for the icon
             flip_horizontal: Whether to flip the image horizontally
         """
-        from pathlib import Path
-
-        from PIL import Image, ImageEnhance, ImageFilter, ImageOps
-
-        icon_file = Path(__file__).parent / image_path
-        if not icon_file.exists():
+        icon_img = _load_image_icon(
+            str(Path(__file__).parent / image_path), size, flip_horizontal, draw._image.mode
+        )
+        if icon_img is None:
             # Fallback to star if image not found
             self.draw_star(draw, x, y, size)
             return
 
-        # Load the image
-        icon_img = Image.open(icon_file)
-
-        # Ensure RGBA for consistent handling
-        icon_img = icon_img.convert("RGBA")
-
-        # Flip horizontally if requested
-        if flip_horizontal:
-            icon_img = icon_img.transpose(Image.FLIP_LEFT_RIGHT)
-
-        # Resize to target size while maintaining aspect ratio
-        icon_img.thumbnail((size, size), Image.Resampling.LANCZOS)
-
-        # Create a white background
-        background = Image.new("RGBA", icon_img.size, (255, 255, 255, 255))
-
-        # Paste the image on white background using alpha channel as mask
-        background = Image.alpha_composite(background, icon_img)
-
-        # Convert to grayscale
-        gray_img = background.convert("L")
-
-        # Check if background is dark (check 4 corners)
-        w, h = gray_img.size
-        corners = [
-            gray_img.getpixel((0, 0)),
-            gray_img.getpixel((w - 1, 0)),
-            gray_img.getpixel((0, h - 1)),
-            gray_img.getpixel((w - 1, h - 1)),
-        ]
-        avg_bg = sum(corners) / 4
-
-        # If background is dark (< 200), invert the image to make it dark-on-light
-        # This handles cases where the icon is light-colored on a dark background
-        if avg_bg < 200:
-            gray_img = ImageOps.invert(gray_img)
-
-        # Enhance contrast for sharper edges
-        enhancer = ImageEnhance.Contrast(gray_img)
-        icon_img = enhancer.enhance(2.0)
-
-        # Apply sharpening filter
-        icon_img = icon_img.filter(ImageFilter.SHARPEN)
-
-        # Convert to 1-bit using threshold
-        # Threshold at 128 (middle value)
-        icon_img = icon_img.point(lambda x: 0 if x < 128 else 255, "1")
-
         # Calculate position to center the image
         paste_x = x - icon_img.width // 2
         paste_y = y - icon_img.height // 2
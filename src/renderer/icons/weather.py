@@ -3,17 +3,57 @@
 Provides weather icon drawing functions with file loading and fallback rendering.
 """
 
+import functools
 import logging
 import math
+from pathlib import Path
 
 from PIL import Image, ImageDraw
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=16)
+def _load_icon(icon_path: str, size: int) -> Image.Image | None:
+    """Decode, flatten and resize a PNG icon once per (path, size).
+
+    Returns:
+        1-bit PIL Image of size x size, or None if the file does not exist
+    """
+    if not Path(icon_path).exists():
+        return None
+
+    icon = Image.open(icon_path)
+
+    # Handle transparency
+    if icon.mode == "P":
+        icon = icon.convert("RGBA")
+    elif icon.mode == "LA":
+        icon = icon.convert("RGBA")
+
+    if icon.mode == "RGBA":
+        background = Image.new("RGB", icon.size, (255, 255, 255))
+        background.paste(icon, mask=icon.split()[3])
+        icon = background
+    elif icon.mode != "RGB":
+        icon = icon.convert("RGB")
+
+    icon = icon.convert("1")
+    return icon.resize((size, size), Image.Resampling.LANCZOS)
+
+
 class WeatherIcons:
     """Handles weather icon rendering."""
 
+    # Icon name -> code-drawn fallback method (unknown names draw a cloud)
+    _FALLBACK_DRAWERS = {
+        "sun": "draw_sun",
+        "rain": "draw_rain",
+        "snow": "draw_snow",
+        "thunder": "draw_thunder",
+        "cloud": "draw_cloud",
+    }
+
     def draw_weather_icon(
         self,
         draw: ImageDraw.ImageDraw,
@@ -25,6 +65,9 @@ class WeatherIcons:
     ) -> bool:
         """Draw weather icon (load from file or fallback to code).
 
+        Icon files are decoded and resized once per (path, size); later
+        refreshes only paste the cached bitmap.
+
         Args:
             draw: PIL ImageDraw object
             x, y: Icon center coordinates
@@ -36,48 +79,21 @@ class WeatherIcons:
             bool: Whether successfully loaded from file
         """
         # Try loading from file
-        if icons_dir and icons_dir.exists():
+        if icons_dir:
             icon_path = icons_dir / f"{icon_name}.png"
-
-            if icon_path.exists():
-                try:
-                    icon = Image.open(icon_path)
-
-                    # Handle transparency
-                    if icon.mode == "P":
-                        icon = icon.convert("RGBA")
-                    elif icon.mode == "LA":
-                        icon = icon.convert("RGBA")
-
-                    if icon.mode == "RGBA":
-                        background = Image.new("RGB", icon.size, (255, 255, 255))
-                        background.paste(icon, mask=icon.split()[3])
-                        icon = background
-                    elif icon.mode != "RGB":
-                        icon = icon.convert("RGB")
-
-                    icon = icon.convert("1")
-                    icon = icon.resize((size, size), Image.Resampling.LANCZOS)
-
+            try:
+                icon = _load_icon(str(icon_path), size)
+                if icon is not None:
                     paste_x = int(x - size // 2)
                     paste_y = int(y - size // 2)
                     draw._image.paste(icon, (paste_x, paste_y))
                     return True
-                except Exception as e:
-                    logger.warning(f"Failed to load icon {icon_path}: {e}, using fallback")
+            except Exception as e:
+                logger.warning(f"Failed to load icon {icon_path}: {e}, using fallback")
 
         # Fallback to code drawing
-        match icon_name:
-            case "sun":
-                self.draw_sun(draw, x, y, size)
-            case "rain":
-                self.draw_rain(draw, x, y, size)
-            case "snow":
-                self.draw_snow(draw, x, y, size)
-            case "thunder":
-                self.draw_thunder(draw, x, y, size)
-            case "cloud" | _:
-                self.draw_cloud(draw, x, y, size)
+        drawer = getattr(self, self._FALLBACK_DRAWERS.get(icon_name, "draw_cloud"))
+        drawer(draw, x, y, size)
         return False
 
     def draw_sun(self, draw, x, y, size=20):
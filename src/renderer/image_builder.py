@@ -5,7 +5,7 @@ This module handles image generation for different display modes.
 
 import logging
 
-from PIL import Image, ImageDraw
+from PIL import Image
 
 from src.config import Config
 from src.layouts import DashboardLayout
@@ -90,26 +90,8 @@ class ImageBuilder:
 
     def _build_holiday(self, data: dict, layout: DashboardLayout) -> Image.Image:
         """Build holiday greeting image."""
-        holiday = data["holiday"]
-        image_mode = "L" if Config.hardware.use_grayscale else "1"
-        image = Image.new(image_mode, (self.width, self.height), 255)
-        draw = ImageDraw.Draw(image)
-
-        layout.renderer.draw_full_screen_message(
-            draw,
-            self.width,
-            self.height,
-            holiday["title"],
-            holiday["message"],
-            holiday.get("icon"),
-        )
-        return image
+        return layout.create_holiday_image(self.width, self.height, data["holiday"])
 
     def _build_year_end(self, data: dict, layout: DashboardLayout) -> Image.Image:
         """Build year-end summary image."""
-        image_mode = "L" if Config.hardware.use_grayscale else "1"
-        image = Image.new(image_mode, (self.width, self.height), 255)
-        draw = ImageDraw.Draw(image)
-
-        layout._draw_year_end_summary(draw, self.width, self.height, data["github_year_summary"])
-        return image
+        return layout.create_year_end_image(self.width, self.height, data["github_year_summary"])
@@ -3,7 +3,9 @@
 Provides functions for drawing progress rings and other shapes.
 """
 
-from PIL import ImageDraw
+import functools
+
+from PIL import Image, ImageDraw
 
 
 class ShapeRenderer:
@@ -25,24 +27,52 @@ class ShapeRenderer:
         thickness: int = 5,
         use_grayscale: bool = False,
     ):
-        """Draw a progress ring with optional grayscale support."""
+        """Draw a progress ring with optional grayscale support.
+
+        Rings are pasted from a sprite cached per (mode, radius, percent,
+        thickness, color), since the displayed percentages change slowly. The
+        square bounding the ring is filled with the background color.
+        """
         ring_color = self.COLOR_DARK_GRAY if use_grayscale else 0
-        bg_color = self.COLOR_WHITE
 
-        bbox = (x - radius, y - radius, x + radius, y + radius)
-        draw.ellipse(bbox, outline=ring_color, width=1)
+        if not (isinstance(x, int) and isinstance(y, int)):
+            # Sub-pixel centers cannot be reproduced by pasting; draw directly
+            _draw_ring(draw, x, y, radius, percent, thickness, ring_color, self.COLOR_WHITE)
+            return
+
+        sprite = _ring_sprite(draw._image.mode, radius, percent, thickness, ring_color)
+        draw._image.paste(sprite, (x - radius, y - radius))
+
+
+def _draw_ring(draw, x, y, radius, percent, thickness, ring_color, bg_color):
+    """Draw the ring outline, progress slice and inner disc."""
+    bbox = (x - radius, y - radius, x + radius, y + radius)
+    draw.ellipse(bbox, outline=ring_color, width=1)
+
+    start_angle = -90
+    try:
+        p = float(percent)
+    except ValueError:
+        p = 0
+
+    end_angle = -90 + (360 * (p / 100.0))
+    if p > 0:
+        draw.pieslice(bbox, start=start_angle, end=end_angle, fill=ring_color)
 
-        start_angle = -90
-        try:
-            p = float(percent)
-        except ValueError:
-            p = 0
+    inner_r = radius - thickness
+    draw.ellipse(
+        (x - inner_r, y - inner_r, x + inner_r, y + inner_r), fill=bg_color, outline=ring_color
+    )
 
-        end_angle = -90 + (360 * (p / 100.0))
-        if p > 0:
-            draw.pieslice(bbox, start=start_angle, end=end_angle, fill=ring_color)
 
-        inner_r = radius - thickness
-        draw.ellipse(
-            (x - inner_r, y - inner_r, x + inner_r, y + inner_r), fill=bg_color, outline=ring_color
-        )
+@functools.lru_cache(maxsize=32)
+def _ring_sprite(
+    mode: str, radius: int, percent: int | float, thickness: int, ring_color: int
+) -> Image.Image:
+    """Render a progress ring on a white square of side 2 * radius + 1."""
+    bg_color = ShapeRenderer.COLOR_WHITE
+    sprite = Image.new(mode, (2 * radius + 1, 2 * radius + 1), bg_color)
+    _draw_ring(
+        ImageDraw.Draw(sprite), radius, radius, radius, percent, thickness, ring_color, bg_color
+    )
+    return sprite
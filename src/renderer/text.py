@@ -3,12 +3,196 @@
 Provides text drawing functions with various alignment and truncation options.
 """
 
-from PIL import ImageDraw, ImageFont
+import functools
+from collections.abc import Callable
+
+from PIL import Image, ImageDraw, ImageFont
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_bbox(font: ImageFont.FreeTypeFont, text: str) -> tuple[int, int, int, int]:
+    """Measure text with FreeType once per (font, text) pair."""
+    return font.getbbox(text)
+
+
+@functools.lru_cache(maxsize=128)
+def _cached_length(font: ImageFont.FreeTypeFont, text: str, mode: str) -> float:
+    """Measure text advance width once per (font, text, font mode)."""
+    return font.getlength(text, mode)
+
+
+def _rasterize(
+    font: ImageFont.FreeTypeFont, text: str, fontmode: str
+) -> tuple[Image.Image, tuple[int, int, int, int]]:
+    """Render text into a coverage mask (ink = 255) plus its bounding box.
+
+    The mask is rendered with the target canvas' font mode, so compositing it
+    with ``ImageDraw.bitmap`` gives the same pixels as ``ImageDraw.text``.
+    """
+    bbox = font.getbbox(text, fontmode)
+    sprite = Image.new("L", (max(bbox[2] - bbox[0], 1), max(bbox[3] - bbox[1], 1)), 0)
+    sprite_draw = ImageDraw.Draw(sprite)
+    sprite_draw.fontmode = fontmode
+    sprite_draw.text((-bbox[0], -bbox[1]), text, font=font, fill=255)
+    return sprite, bbox
+
+
+@functools.lru_cache(maxsize=64)
+def _text_sprite(
+    font: ImageFont.FreeTypeFont, text: str, fontmode: str
+) -> tuple[Image.Image, tuple[int, int, int, int]]:
+    """Rasterize text once per (font, text, font mode); see _rasterize."""
+    return _rasterize(font, text, fontmode)
+
+
+def _truncate(text: str, max_width: float, get_w: Callable[[str], float]) -> str | None:
+    """Truncate text with an ellipsis so that get_w(result) fits max_width.
+
+    Returns:
+        text itself if it fits, the longest prefix plus "..." that fits, or
+        None if not even one character fits
+    """
+    if get_w(text) <= max_width:
+        return text
+
+    # Prefix width grows with length, so binary search for the longest
+    # prefix that still fits next to the ellipsis (O(log n) measurements)
+    ellipsis = "..."
+    budget = max_width - get_w(ellipsis)
+    lo, hi = 0, len(text)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if get_w(text[:mid]) <= budget:
+            lo = mid
+        else:
+            hi = mid - 1
+
+    if lo == 0:
+        return None
+    return text[:lo] + ellipsis
+
+
+@functools.lru_cache(maxsize=128)
+def _fit_text(font: ImageFont.FreeTypeFont, text: str, max_width: float, mode: str) -> str | None:
+    """Truncate text to max_width once per (font, text, width, font mode)."""
+    return _truncate(text, max_width, lambda t: font.getlength(t, mode))
+
+
+# Characters covered by the glyph atlas (clock digits)
+ATLAS_CHARS = "0123456789:"
+
+# (coverage mask, bbox, advance width) of a single character
+Glyph = tuple[Image.Image, tuple[int, int, int, int], float]
+
+
+def _place_glyphs(
+    atlas: dict[str, Glyph], text: str
+) -> tuple[list[tuple[int, Image.Image, tuple[int, int, int, int]]], tuple[int, int, int, int]]:
+    """Lay out atlas glyphs at the pen positions ImageDraw.text would use.
+
+    Returns:
+        List of (x offset, mask, glyph bbox) and the bounding box of the whole text
+    """
+    placed = []
+    pen = 0.0
+    for ch in text:
+        mask, bbox, advance = atlas[ch]
+        placed.append((int(pen), mask, bbox))
+        pen += advance
+
+    text_bbox = (
+        min(px + bbox[0] for px, _, bbox in placed),
+        min(bbox[1] for _, _, bbox in placed),
+        max(px + bbox[2] for px, _, bbox in placed),
+        max(bbox[3] for _, _, bbox in placed),
+    )
+    return placed, text_bbox
+
+
+def _blit_glyphs(
+    draw: ImageDraw.ImageDraw,
+    x: int,
+    y: int,
+    placed: list[tuple[int, Image.Image, tuple[int, int, int, int]]],
+    fill: int | str,
+) -> None:
+    """Composite placed glyphs with the text origin at (x, y)."""
+    for px, mask, bbox in placed:
+        draw.bitmap((x + px + bbox[0], y + bbox[1]), mask, fill=fill)
+
+
+@functools.lru_cache(maxsize=16)
+def _glyph_atlas(font: ImageFont.FreeTypeFont, fontmode: str) -> dict[str, Glyph] | None:
+    """Rasterize ATLAS_CHARS once per (font, font mode).
+
+    Glyphs are only independent of their neighbours if the font neither kerns
+    them nor rounds their vertical placement per line, so every character pair
+    is checked against ``ImageDraw.text`` once before the atlas is used.
+
+    Returns:
+        Mapping of character to Glyph, or None when the font fails the check
+    """
+    atlas = {
+        ch: (*_rasterize(font, ch, fontmode), font.getlength(ch, fontmode)) for ch in ATLAS_CHARS
+    }
+    for a in ATLAS_CHARS:
+        for b in ATLAS_CHARS:
+            placed, bbox = _place_glyphs(atlas, a + b)
+            if bbox != font.getbbox(a + b, fontmode):
+                return None
+            expected = Image.new("L", (bbox[2], bbox[3]), 255)
+            expected_draw = ImageDraw.Draw(expected)
+            expected_draw.fontmode = fontmode
+            expected_draw.text((0, 0), a + b, font=font, fill=0)
+            actual = Image.new("L", (bbox[2], bbox[3]), 255)
+            _blit_glyphs(ImageDraw.Draw(actual), 0, 0, placed, 0)
+            if actual.tobytes() != expected.tobytes():
+                return None
+    return atlas
 
 
 class TextRenderer:
     """Handles text rendering operations."""
 
+    def get_text_bbox(self, text: str, font: ImageFont.FreeTypeFont) -> tuple[int, int, int, int]:
+        """Get text bounding box relative to the origin (memoized).
+
+        Labels such as weather descriptions come from a small set of strings,
+        so repeated refreshes reuse the measurement instead of re-running layout.
+        """
+        return _cached_bbox(font, text)
+
+    def measure_width(self, text: str, font: ImageFont.FreeTypeFont, mode: str = "L") -> float:
+        """Get text advance width, as ``ImageDraw.textlength`` reports it (memoized).
+
+        Args:
+            text: Text to measure
+            font: Font to measure with
+            mode: Font rendering mode, i.e. ``draw.fontmode`` of the target canvas
+
+        Returns:
+            Advance width in pixels
+        """
+        return _cached_length(font, text, mode)
+
+    def warm_up(
+        self, fonts: list[ImageFont.FreeTypeFont], labels: list[str], fontmode: str = "L"
+    ) -> None:
+        """Pre-measure and rasterize known labels so the first refresh hits the caches.
+
+        Fills the caches behind ``get_text_bbox`` and the ``draw_*cached_text``
+        helpers.
+
+        Args:
+            fonts: Fonts the labels are drawn with
+            labels: Strings known to appear on screen
+            fontmode: Font rendering mode, i.e. ``draw.fontmode`` of the target canvas
+        """
+        for font in fonts:
+            for label in labels:
+                _cached_bbox(font, label)
+                _text_sprite(font, label, fontmode)
+
     def draw_text(
         self,
         draw: ImageDraw.ImageDraw,
@@ -43,6 +227,83 @@ class TextRenderer:
         y_offset = (h // 2 + 3) if align_y_center else 0
         draw.text((x - w // 2, y - y_offset), text, font=font, fill=fill)
 
+    def draw_cached_text(
+        self,
+        draw: ImageDraw.ImageDraw,
+        x: int,
+        y: int,
+        text: str,
+        font: ImageFont.FreeTypeFont,
+        fill: int | str = 0,
+    ):
+        """Draw text like ``draw_text`` from a cached glyph sprite.
+
+        Meant for strings that repeat across frames (labels, weather
+        descriptions); coordinates must be integers.
+        """
+        sprite, bbox = _text_sprite(font, text, draw.fontmode)
+        draw.bitmap((x + bbox[0], y + bbox[1]), sprite, fill=fill)
+
+    def draw_centered_cached_text(
+        self,
+        draw: ImageDraw.ImageDraw,
+        x: int,
+        y: int,
+        text: str,
+        font: ImageFont.FreeTypeFont,
+        fill: int | str = 0,
+        align_y_center: bool = True,
+    ):
+        """Draw centered text like ``draw_centered_text`` from a cached glyph sprite."""
+        sprite, bbox = _text_sprite(font, text, draw.fontmode)
+        w = bbox[2] - bbox[0]
+        h = bbox[3] - bbox[1]
+
+        y_offset = (h // 2 + 3) if align_y_center else 0
+        draw.bitmap((x - w // 2 + bbox[0], y - y_offset + bbox[1]), sprite, fill=fill)
+
+    def draw_centered_atlas_text(
+        self,
+        draw: ImageDraw.ImageDraw,
+        x: int,
+        y: int,
+        text: str,
+        font: ImageFont.FreeTypeFont,
+        fill: int | str = 0,
+        align_y_center: bool = True,
+    ):
+        """Draw centered text like ``draw_centered_text`` from pre-rasterized glyphs.
+
+        Meant for short numeric strings that change often (the clock), where a
+        whole-string sprite would rarely be reused. Text with characters outside
+        ATLAS_CHARS, or in a font that fails the atlas check, goes through
+        ``draw_centered_text``.
+        """
+        atlas = _glyph_atlas(font, draw.fontmode)
+        if not text or atlas is None or not all(ch in atlas for ch in text):
+            self.draw_centered_text(draw, x, y, text, font, fill, align_y_center)
+            return
+
+        placed, bbox = _place_glyphs(atlas, text)
+        y_offset = ((bbox[3] - bbox[1]) // 2 + 3) if align_y_center else 0
+        _blit_glyphs(draw, x - (bbox[2] - bbox[0]) // 2, y - y_offset, placed, fill)
+
+    def fit_text(
+        self, text: str, font: ImageFont.FreeTypeFont, max_width: float, mode: str = "L"
+    ) -> str | None:
+        """Get the text ``draw_truncated_text`` would draw, without drawing it (memoized).
+
+        Args:
+            text: Text to fit
+            font: Font to measure with
+            max_width: Maximum width in pixels
+            mode: Font rendering mode, i.e. ``draw.fontmode`` of the target canvas
+
+        Returns:
+            The text, truncated with "..." if needed, or None if nothing fits
+        """
+        return _fit_text(font, text, max_width, mode)
+
     def draw_truncated_text(
         self,
         draw: ImageDraw.ImageDraw,
@@ -66,18 +327,10 @@ class TextRenderer:
                 w, _ = draw.textsize(t, font=font)
                 return w
 
-        if get_w(text) <= max_width:
-            draw.text((x, y), text, font=font, fill=fill)
-            bbox = draw.textbbox((x, y), text, font=font)
-            return bbox
+        final_text = _truncate(text, max_width, get_w)
+        if final_text is None:
+            return None
 
-        ellipsis = "..."
-        for i in range(len(text), 0, -1):
-            temp = text[:i]
-            if get_w(temp) + get_w(ellipsis) <= max_width:
-                final_text = temp + ellipsis
-                draw.text((x, y), final_text, font=font, fill=fill)
-                bbox = draw.textbbox((x, y), final_text, font=font)
-                return bbox
-
-        return None
+        draw.text((x, y), final_text, font=font, fill=fill)
+        bbox = draw.textbbox((x, y), final_text, font=font)
+        return bbox
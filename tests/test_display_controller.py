@@ -60,3 +60,18 @@ class TestDisplayController:
         mode = controller.get_current_mode(now)
         # Mode should be one of the valid modes
         assert mode in ["dashboard", "quote", "poetry", "wallpaper", "holiday"]
+
+    def test_special_mode_checked_once_per_day(self, monkeypatch):
+        """Test holiday detection runs once per date, not on every refresh."""
+        from src.layouts.holiday import HolidayManager
+
+        calls = []
+        monkeypatch.setattr(HolidayManager, "get_holiday", lambda self: calls.append(1))
+        controller = DisplayController()
+
+        controller.get_current_mode(pendulum.parse("2024-06-15 12:00:00"))
+        controller.get_current_mode(pendulum.parse("2024-06-15 12:05:00"))
+        assert len(calls) == 1
+
+        assert controller.get_current_mode(pendulum.parse("2024-12-31 00:01:00")) == "year_end"
+        assert len(calls) == 2
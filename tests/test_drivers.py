@@ -0,0 +1,43 @@
+"""Tests for display driver adapters."""
+
+from unittest.mock import MagicMock
+
+from PIL import Image
+
+from src.drivers.waveshare import WaveshareEPDDriver
+
+
+def _make_driver(model_name: str) -> WaveshareEPDDriver:
+    """Build a driver around a mock EPD without importing hardware modules."""
+    driver = object.__new__(WaveshareEPDDriver)
+    driver.epd = MagicMock()
+    driver.width, driver.height = 16, 4
+    driver.use_grayscale = False
+    driver.model_name = model_name
+    driver._bw_buffer = None
+    return driver
+
+
+def test_pack_bw_matches_inverted_rows():
+    """Test fast B/W packing equals the driver's inverted 1-bit row format."""
+    driver = _make_driver("epd7in5_V2")
+    image = Image.new("1", (16, 4), 255)
+    image.putpixel((0, 0), 0)
+    image.putpixel((9, 3), 0)
+
+    expected = bytearray(image.tobytes("raw"))
+    for i in range(len(expected)):
+        expected[i] ^= 0xFF
+
+    first = driver.getbuffer(image)
+    assert first == expected
+    assert driver.getbuffer(image.convert("L")) is first
+    driver.epd.getbuffer.assert_not_called()
+
+
+def test_pack_bw_falls_back_for_other_models():
+    """Test models with an unknown buffer layout keep using their own getbuffer."""
+    driver = _make_driver("epd2in13_V2")
+    image = Image.new("1", (16, 4), 255)
+
+    assert driver.getbuffer(image) is driver.epd.getbuffer.return_value
@@ -6,7 +6,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 from PIL import Image
 
-from src.renderer.icons.weather import WeatherIcons
+from src.renderer.icons.weather import WeatherIcons, _load_icon
 
 
 class TestWeatherIcons:
@@ -37,6 +37,21 @@ class TestWeatherIcons:
         assert result is True
         mock_draw._image.paste.assert_called()
 
+    def test_draw_weather_icon_file_decoded_once(self, icons, mock_draw, tmp_path):
+        """Test an icon file is decoded once and the cached bitmap is reused."""
+        Image.new("RGBA", (20, 20), (0, 0, 0, 255)).save(tmp_path / "rain.png")
+
+        with patch("src.renderer.icons.weather.Image.open", wraps=Image.open) as mock_open:
+            for _ in range(3):
+                assert icons.draw_weather_icon(
+                    mock_draw, 100, 100, "rain", size=30, icons_dir=tmp_path
+                )
+
+        mock_open.assert_called_once()
+        icon = _load_icon(str(tmp_path / "rain.png"), 30)
+        assert (icon.mode, icon.size) == ("1", (30, 30))
+        mock_draw._image.paste.assert_called_with(icon, (85, 85))
+
     def test_draw_weather_icon_fallback(self, icons, mock_draw):
         """Test fallback to code drawing when file missing."""
         # Use non-existent directory
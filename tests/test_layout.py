@@ -1,11 +1,32 @@
 """Tests for dashboard layout and image generation."""
 
+import pytest
 from PIL import Image
 
 from src.config import Config
 from src.layouts import DashboardLayout
 
 
+@pytest.fixture
+def fixed_now(monkeypatch):
+    """Freeze the dashboard clock so consecutive frames fall in the same minute."""
+    import datetime
+
+    import src.layouts.dashboard as dashboard_module
+
+    now = datetime.datetime(2025, 3, 14, 9, 26, 53)
+
+    class FixedDateTime(datetime.datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return now
+
+    monkeypatch.setattr(
+        dashboard_module, "datetime", type("datetime", (), {"datetime": FixedDateTime})
+    )
+    return now
+
+
 def test_layout_creation(monkeypatch):
     """Test basic layout creation with TODO lists."""
     # Mock Config to ensure consistent data - patch the grouped config
@@ -101,3 +122,425 @@ def test_layout_hackernews_mode(monkeypatch):
     assert isinstance(img, Image.Image)
     assert img.size == (800, 480)
     assert img.mode == "1"
+
+
+def test_static_background_cached(monkeypatch):
+    """Test static background layer is built once and reused across frames."""
+    monkeypatch.setattr(Config.hardware, "use_grayscale", False)
+
+    layout = DashboardLayout()
+    data = {"show_hackernews": False, "todo_goals": ["Goal 1"]}
+
+    first = layout.create_image(800, 480, data)
+    background = layout._static_bg_cache[(800, 480, "1", False)]
+    second = layout.create_image(800, 480, data)
+
+    assert len(layout._static_bg_cache) == 1
+    assert layout._static_bg_cache[(800, 480, "1", False)] is background
+    assert first is not background and second is not background
+
+
+def test_unchanged_inputs_reuse_previous_frame(monkeypatch, fixed_now):
+    """Test identical inputs within the same minute skip redrawing."""
+    monkeypatch.setattr(Config.hardware, "use_grayscale", False)
+
+    layout = DashboardLayout()
+    data = {"show_hackernews": False, "todo_goals": ["Goal 1"], "week_progress": 10}
+
+    first = layout.create_image(800, 480, data)
+    for component in (layout.header, layout.todo_list, layout.footer):
+        monkeypatch.setattr(component, "draw", lambda *args: pytest.fail("redrawn"))
+    second = layout.create_image(800, 480, data)
+
+    assert second is not first
+    assert second.tobytes() == first.tobytes()
+
+    # Any changed input triggers a redraw
+    with pytest.raises(pytest.fail.Exception):
+        layout.create_image(800, 480, dict(data, week_progress=11))
+
+
+def test_in_place_input_mutation_triggers_redraw(monkeypatch, fixed_now):
+    """Test dict inputs mutated in place are not mistaken for unchanged ones."""
+    monkeypatch.setattr(Config.hardware, "use_grayscale", False)
+
+    weather = {"temp": "20", "desc": "Clear", "icon": "Clear"}
+    btc = {"usd": 50000, "usd_24h_change": 1.0}
+    hn = {"stories": [{"title": "Story", "score": 1}], "start_idx": 1, "end_idx": 5}
+    data = {"show_hackernews": True, "hackernews": hn, "weather": weather, "btc_price": btc}
+
+    layout = DashboardLayout()
+    layout.create_image(800, 480, data)
+
+    weather["temp"] = "21"
+    layout.create_image(800, 480, data)
+    assert layout.last_dirty_bbox == (0, 0, 800, layout.header.LINE_TOP_Y)
+
+    hn["stories"][0]["score"] = 2
+    btc["usd"] = 60000
+    layout.create_image(800, 480, data)
+    assert layout.last_dirty_bbox == (0, layout.todo_list.LIST_HEADER_Y, 800, 480)
+
+
+def test_only_changed_sections_redrawn(monkeypatch, fixed_now):
+    """Test a frame redraws only the sections whose inputs changed."""
+    monkeypatch.setattr(Config.hardware, "use_grayscale", False)
+
+    data = {
+        "show_hackernews": False,
+        "todo_goals": ["Goal 1"],
+        "week_progress": 10,
+        "weather": {"temp": "20", "desc": "Clear", "icon": "Clear"},
+    }
+    changed = dict(data, week_progress=90)
+
+    layout = DashboardLayout()
+    layout.create_image(800, 480, data)
+    monkeypatch.setattr(layout.header, "draw", lambda *args: pytest.fail("header redrawn"))
+    monkeypatch.setattr(layout.todo_list, "draw", lambda *args: pytest.fail("lists redrawn"))
+    partial = layout.create_image(800, 480, changed)
+
+    assert layout.last_dirty_bbox == (0, layout.todo_list.LINE_BOTTOM_Y, 800, 480)
+    assert partial.tobytes() == DashboardLayout().create_image(800, 480, changed).tobytes()
+
+
+def test_todo_columns_rerender_only_changed(monkeypatch):
+    """Test unchanged TODO columns reuse their rendered mask."""
+    monkeypatch.setattr(Config.hardware, "use_grayscale", False)
+
+    layout = DashboardLayout()
+    data = {"todo_goals": ["Goal 1"], "todo_must": ["Must 1"], "todo_optional": ["Opt 1"]}
+
+    layout.create_image(800, 480, data)
+    masks = {idx: entry[1] for idx, entry in layout.todo_list._col_cache.items()}
+    layout.create_image(800, 480, dict(data, todo_must=["Must 2"]))
+    cache = layout.todo_list._col_cache
+
+    assert cache[0][1] is masks[0]
+    assert cache[1][1] is not masks[1]
+    assert cache[2][1] is masks[2]
+
+
+@pytest.mark.parametrize("use_grayscale", [False, True])
+def test_static_labels_warmed_up(monkeypatch, use_grayscale):
+    """Test drawing the static labels only hits caches filled at startup."""
+    from src.renderer.text import _cached_bbox, _text_sprite
+
+    monkeypatch.setattr(Config.hardware, "use_grayscale", use_grayscale)
+    _text_sprite.cache_clear()
+    _cached_bbox.cache_clear()
+
+    layout = DashboardLayout()
+    misses = _text_sprite.cache_info().misses
+    layout._get_static_background(800, 480, "L" if use_grayscale else "1", False)
+
+    assert _text_sprite.cache_info().misses == misses
+    assert _cached_bbox.cache_info().currsize == len(
+        {layout.header.UPDATED_LABEL, "Clear", "Cloudy", "Rain", "Drizzle", "Snow", "Storm"}
+        | {label for label in layout.footer.STATIC_LABELS if label}
+        | set(layout.todo_list.HEADERS)
+    )
+
+
+def test_header_footer_item_types_are_known():
+    """Test every slot type has a renderer, so the unknown-type fallbacks stay cold."""
+    layout = DashboardLayout()
+
+    assert set(layout.header.ITEM_TYPES) <= layout.header._HEADER_DRAWERS.keys()
+    assert set(layout.footer.ITEM_TYPES) <= {"ring", "cross", "text"}
+    assert len(layout.footer.ITEM_TYPES) == len(layout.footer.STATIC_LABELS)
+
+
+def test_header_footer_formatters():
+    """Test cached header/footer string formatters match the displayed formats."""
+    import datetime
+
+    from src.layouts.components.footer import _format_btc, _format_percent
+    from src.layouts.components.header import _format_date, _format_time
+
+    assert _format_date(datetime.date(2025, 3, 14)) == ("Fri, 14", "Mar 2025")
+    assert _format_time(9, 5) == "09:05"
+    assert _format_btc(50000, 5.0) == ("$50,000", "BTC (+5.0%)")
+    assert _format_btc(50000, 5.0) is _format_btc(50000, 5.0)
+    assert _format_percent(75) == "75%"
+
+
+def test_hackernews_score_width_cached():
+    """Test the score label width is measured once per font and text."""
+    from src.layouts.components.hackernews import _score_width
+
+    font = DashboardLayout().renderer.font_s
+    bbox = font.getbbox("100▲")
+    _score_width.cache_clear()
+
+    assert _score_width(font, "100▲") == bbox[2] - bbox[0]
+    _score_width(font, "100▲")
+    assert _score_width.cache_info().hits == 1
+
+
+def test_hackernews_rows_bypass_sprite_cache():
+    """Test one-off story rows stay out of the sprite cache; only the header uses it."""
+    from PIL import ImageDraw
+
+    from src.renderer.text import _text_sprite
+
+    hn = DashboardLayout().hackernews
+    font_s = hn.renderer.font_s
+    data = {"stories": [{"title": "Story", "score": 42}], "start_idx": 1, "end_idx": 5}
+
+    _text_sprite.cache_clear()
+    actual = Image.new("1", (800, 480), 255)
+    hn.draw(ImageDraw.Draw(actual), 800, data)
+    assert _text_sprite.cache_info().currsize == 1
+
+    expected = Image.new("1", (800, 480), 255)
+    expected_draw = ImageDraw.Draw(expected)
+    hn.renderer.draw_centered_text(
+        expected_draw, 400, hn.LIST_HEADER_Y, "HN 1~5", hn.renderer.font_m, align_y_center=False
+    )
+    score_bbox = font_s.getbbox("42▲")
+    expected_draw.text((40, hn.LIST_START_Y), "1. Story", font=font_s, fill=0)
+    expected_draw.text(
+        (760 - (score_bbox[2] - score_bbox[0]), hn.LIST_START_Y), "42▲", font=font_s, fill=0
+    )
+    assert actual.tobytes() == expected.tobytes()
+
+
+@pytest.mark.parametrize("mode", ["1", "L"])
+def test_todo_strikethrough_matches_line(monkeypatch, mode):
+    """Test the filled strikethrough bar covers the pixels draw.line would."""
+    from PIL import ImageDraw
+
+    monkeypatch.setattr(Config.hardware, "use_grayscale", False)
+    todo = DashboardLayout().todo_list
+    bbox = (10, 5, 150, 29)
+
+    actual = Image.new(mode, (200, 40), 0)
+    actual_draw = ImageDraw.Draw(actual)
+    todo._draw_strikethrough(actual_draw, 10, 5, bbox, "• Done", fill=255)
+
+    expected = Image.new(mode, (200, 40), 0)
+    bullet_w = todo.renderer.measure_width("• ", todo.renderer.font_s, actual_draw.fontmode)
+    ImageDraw.Draw(expected).line([(10 + bullet_w, 17), (150, 17)], fill=255, width=2)
+
+    assert actual.tobytes() == expected.tobytes()
+
+
+def test_todo_limit_list_items():
+    """Test long TODO lists are cut with an ellipsis without mutating the input."""
+    layout = DashboardLayout()
+    items = ["A", "B", "C", "D", "E", "F"]
+
+    limited = layout.todo_list._limit_list_items(items, 5)
+    assert limited == ("A", "B", "C", "D", "...")
+    assert items == ["A", "B", "C", "D", "E", "F"]
+    assert layout.todo_list._limit_list_items(items[:5], 5) == tuple(items[:5])
+
+    # Unchanged input returns the memoized tuple
+    assert layout.todo_list._limit_list_items(list(items), 5) is limited
+
+
+def test_dirty_bbox_covers_changed_sections(monkeypatch, fixed_now):
+    """Test the dirty region hint only spans the sections whose inputs changed."""
+    monkeypatch.setattr(Config.hardware, "use_grayscale", False)
+
+    layout = DashboardLayout()
+    data = {"todo_goals": ["Goal 1"], "week_progress": 10}
+
+    layout.create_image(800, 480, data)
+    assert layout.last_dirty_bbox == (0, 0, 800, 480)
+    layout.create_image(800, 480, data)
+    assert layout.last_dirty_bbox is None
+
+    # Footer only
+    layout.create_image(800, 480, dict(data, week_progress=11))
+    assert layout.last_dirty_bbox == (0, layout.todo_list.LINE_BOTTOM_Y, 800, 480)
+
+    # Lists and footer
+    layout.create_image(800, 480, dict(data, todo_goals=["Goal 2"]))
+    assert layout.last_dirty_bbox == (0, layout.todo_list.LIST_HEADER_Y, 800, 480)
+
+
+def test_dividers_live_in_static_background(monkeypatch):
+    """Test both divider lines are part of the cached static layer."""
+    monkeypatch.setattr(Config.hardware, "use_grayscale", False)
+
+    layout = DashboardLayout()
+    background = layout._get_static_background(800, 480, "1", False)
+
+    assert background.getpixel((400, layout.header.LINE_TOP_Y)) == 0
+    assert background.getpixel((400, layout.todo_list.LINE_BOTTOM_Y)) == 0
+
+
+def test_year_end_summary_uses_passed_time(monkeypatch):
+    """Test the year-end title uses the caller's time instead of reading the clock."""
+    import datetime
+
+    from PIL import ImageDraw
+
+    layout = DashboardLayout()
+    years = []
+    monkeypatch.setattr(layout.year_end, "_draw_title", lambda draw, cx, year: years.append(year))
+
+    image = Image.new("1", (800, 480), 255)
+    layout._draw_year_end_summary(
+        ImageDraw.Draw(image), 800, 480, {}, now=datetime.datetime(2030, 12, 31, 9, 0)
+    )
+
+    assert years == [2030]
+
+
+def test_year_end_icons_decoded_once():
+    """Test year-end icons are decoded on the first draw and pasted from cache after."""
+    from PIL import ImageDraw
+
+    from src.renderer.icons.holiday import _load_image_icon
+
+    layout = DashboardLayout()
+    summary = {"top_languages": ["Python", "Go"]}
+    _load_image_icon.cache_clear()
+
+    first = Image.new("1", (800, 480), 255)
+    layout._draw_year_end_summary(ImageDraw.Draw(first), 800, 480, summary)
+    decoded = _load_image_icon.cache_info().misses
+    second = Image.new("1", (800, 480), 255)
+    layout._draw_year_end_summary(ImageDraw.Draw(second), 800, 480, summary)
+
+    assert _load_image_icon.cache_info().misses == decoded
+    assert second.tobytes() == first.tobytes()
+
+
+def test_year_end_static_layer_rendered_once(monkeypatch):
+    """Test the year-end title and bottom message are rendered once per year."""
+    import datetime
+
+    from PIL import ImageDraw
+
+    layout = DashboardLayout()
+    now = datetime.datetime(2030, 12, 31, 9, 0)
+
+    first = Image.new("1", (800, 480), 255)
+    layout._draw_year_end_summary(ImageDraw.Draw(first), 800, 480, {}, now=now)
+    monkeypatch.setattr(layout.year_end, "_draw_title", lambda *a: pytest.fail("redrawn"))
+    second = Image.new("1", (800, 480), 255)
+    layout._draw_year_end_summary(ImageDraw.Draw(second), 800, 480, {}, now=now)
+
+    assert second.tobytes() == first.tobytes()
+
+    # A new year renders the layer again
+    with pytest.raises(pytest.fail.Exception):
+        layout._draw_year_end_summary(
+            ImageDraw.Draw(second), 800, 480, {}, now=now.replace(year=2031)
+        )
+
+
+def test_year_end_stats_positions():
+    """Test statistics are spread evenly and the positions are memoized."""
+    from src.layouts.components.year_end import _stats_x_positions
+
+    assert _stats_x_positions(800, 7) == (100, 200, 300, 400, 500, 600, 700)
+    assert _stats_x_positions(800, 7) is _stats_x_positions(800, 7)
+
+
+def test_released_frame_reused_as_canvas(monkeypatch):
+    """Test frames handed back via release() are recycled for later frames."""
+    monkeypatch.setattr(Config.hardware, "use_grayscale", False)
+
+    layout = DashboardLayout()
+    first = layout.create_image(800, 480, {"todo_goals": ["Goal 1"]})
+    expected = layout.create_image(800, 480, {"todo_goals": ["Goal 2"]}).tobytes()
+    layout._last_frame_sig = None
+
+    layout.release(first)
+    layout.release(first)
+    assert sum(canvas is first for canvas in layout._canvas_pool) == 1
+
+    second = layout.create_image(800, 480, {"todo_goals": ["Goal 2"]})
+    assert second.tobytes() == expected
+    assert layout._last_image is first or second is first
+    layout.release(layout._last_image)
+    assert all(canvas is not layout._last_image for canvas in layout._canvas_pool)
+
+
+def test_holiday_image_rendered_once(monkeypatch):
+    """Test the holiday greeting is rendered once and then copied."""
+    monkeypatch.setattr(Config.hardware, "use_grayscale", False)
+
+    layout = DashboardLayout()
+    holiday = {"title": "Happy Birthday!", "message": "To You", "icon": "birthday"}
+
+    first = layout.create_holiday_image(800, 480, holiday)
+    monkeypatch.setattr(
+        layout.renderer, "draw_full_screen_message", lambda *args: pytest.fail("redrawn")
+    )
+    second = layout.create_holiday_image(800, 480, holiday)
+
+    assert second is not first
+    assert second.tobytes() == first.tobytes()
+
+
+def test_holiday_mode_reuses_shared_layout(monkeypatch):
+    """Test the holiday mode renders through the shared layout and its cache."""
+    from src.layouts import get_dashboard_layout
+    from src.modes import HolidayMode
+
+    monkeypatch.setattr(Config.hardware, "use_grayscale", False)
+
+    layout = get_dashboard_layout()
+    calls = []
+    render = layout.renderer.draw_full_screen_message
+    monkeypatch.setattr(
+        layout.renderer,
+        "draw_full_screen_message",
+        lambda *args: calls.append(args) or render(*args),
+    )
+    data = {"holiday": {"title": "Shared Layout Day", "message": "Hi", "icon": None}}
+
+    mode = HolidayMode()
+    first = mode.render(800, 480, data)
+    second = mode.render(800, 480, data)
+
+    assert get_dashboard_layout() is layout
+    assert len(calls) == 1
+    assert second.tobytes() == first.tobytes()
+
+
+def test_year_end_image_rendered_once(monkeypatch):
+    """Test the year-end summary is only redrawn when its data changes."""
+    monkeypatch.setattr(Config.hardware, "use_grayscale", False)
+
+    layout = DashboardLayout()
+    summary = {"total_contributions": 1234, "top_languages": ["Python"]}
+
+    first = layout.create_year_end_image(800, 480, summary)
+    monkeypatch.setattr(layout.year_end, "draw", lambda *args: pytest.fail("redrawn"))
+    second = layout.create_year_end_image(800, 480, dict(summary))
+
+    assert second is not first
+    assert second.tobytes() == first.tobytes()
+
+    with pytest.raises(pytest.fail.Exception):
+        layout.create_year_end_image(800, 480, dict(summary, total_contributions=1235))
+
+
+def test_year_end_mode_reuses_shared_layout(monkeypatch):
+    """Test the year-end mode renders through the shared layout and its cache."""
+    from src.layouts import get_dashboard_layout
+    from src.modes import YearEndMode
+
+    monkeypatch.setattr(Config.hardware, "use_grayscale", False)
+
+    layout = get_dashboard_layout()
+    calls = []
+    render = layout._draw_year_end_summary
+    monkeypatch.setattr(
+        layout, "_draw_year_end_summary", lambda *args: calls.append(args) or render(*args)
+    )
+    data = {"github_year_summary": {"total_contributions": 4321}}
+
+    mode = YearEndMode()
+    first = mode.render(800, 480, data)
+    second = mode.render(800, 480, data)
+
+    assert len(calls) == 1
+    assert second.tobytes() == first.tobytes()
@@ -10,6 +10,7 @@ from src.layouts.utils.layout_helper import (
     GridLayout,
     LayoutConstants,
     LayoutHelper,
+    get_layout_helper,
 )
 
 
@@ -277,6 +278,14 @@ class TestLayoutHelper:
         assert layout.width == 800
         assert layout.num_cols == 3
 
+    def test_get_column_centers(self, helper):
+        """Test column centers match ColumnLayout and are memoized."""
+        centers = helper.get_column_centers(width=800, num_cols=4, padding=20)
+        layout = ColumnLayout(800, 4, 20)
+
+        assert centers == tuple(layout.get_column_center(i) for i in range(4))
+        assert helper.get_column_centers(width=800, num_cols=4, padding=20) is centers
+
     def test_create_grid_layout(self, helper):
         """Test creating grid layout."""
         layout = helper.create_grid_layout(width=800, height=480, rows=3, cols=4)
@@ -335,3 +344,9 @@ class TestLayoutHelper:
         # Verify all line calls use the specified width
         for call in mock_draw.line.call_args_list:
             assert call[1]["width"] == LayoutConstants.LINE_THICK
+
+    def test_get_layout_helper_shared_per_mode(self):
+        """Test components share one helper per color mode."""
+        assert get_layout_helper(False) is get_layout_helper(False)
+        assert get_layout_helper(True) is not get_layout_helper(False)
+        assert get_layout_helper(True).use_grayscale is True
@@ -0,0 +1,27 @@
+"""Tests for shape renderer module."""
+
+import pytest
+from PIL import Image, ImageDraw
+
+from src.renderer.shapes import ShapeRenderer, _draw_ring
+
+
+class TestShapeRenderer:
+    """Tests for ShapeRenderer class."""
+
+    @pytest.mark.parametrize(
+        ("mode", "use_grayscale", "percent"),
+        [("1", False, 0), ("1", False, 75), ("L", True, 33.3), ("L", True, 100)],
+    )
+    def test_progress_ring_sprite_matches_direct_draw(self, mode, use_grayscale, percent):
+        """Test the cached ring sprite reproduces direct drawing."""
+        ring_color = ShapeRenderer.COLOR_DARK_GRAY if use_grayscale else 0
+        expected = Image.new(mode, (120, 120), 255)
+        _draw_ring(ImageDraw.Draw(expected), 60, 60, 32, percent, 6, ring_color, 255)
+
+        actual = Image.new(mode, (120, 120), 255)
+        ShapeRenderer().draw_progress_ring(
+            ImageDraw.Draw(actual), 60, 60, 32, percent, thickness=6, use_grayscale=use_grayscale
+        )
+
+        assert actual.tobytes() == expected.tobytes()
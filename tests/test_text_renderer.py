@@ -124,3 +124,98 @@ class TestTextRenderer:
         # Should return None if can't fit anything
         # Or draw minimal text - depends on implementation
         assert bbox is None or bbox is not None  # Either is acceptable
+
+    def test_get_text_bbox_memoized(self, renderer, mock_font):
+        """Test text bbox measurement is cached per (font, text)."""
+        mock_font.getbbox.return_value = (0, 2, 40, 20)
+
+        assert renderer.get_text_bbox("Cloudy", mock_font) == (0, 2, 40, 20)
+        assert renderer.get_text_bbox("Cloudy", mock_font) == (0, 2, 40, 20)
+
+        mock_font.getbbox.assert_called_once_with("Cloudy")
+
+    def test_measure_width_memoized_per_mode(self, renderer, mock_font):
+        """Test advance width measurement is cached per (font, text, mode)."""
+        mock_font.getlength.return_value = 12.5
+
+        assert renderer.measure_width("• ", mock_font, "1") == 12.5
+        assert renderer.measure_width("• ", mock_font, "1") == 12.5
+        renderer.measure_width("• ", mock_font, "L")
+
+        assert mock_font.getlength.call_count == 2
+        mock_font.getlength.assert_any_call("• ", "1")
+
+    @pytest.mark.parametrize("mode", ["1", "L"])
+    def test_cached_text_matches_draw_text(self, renderer, mode):
+        """Test sprite-based text draws the same pixels as ImageDraw.text."""
+        from PIL import Image
+
+        font = ImageFont.load_default(size=24)
+        expected = Image.new(mode, (200, 60), 255)
+        ImageDraw.Draw(expected).text((13, 9), "Cloudy", font=font, fill=0)
+
+        # Second canvas is drawn from the cached sprite
+        for _ in range(2):
+            actual = Image.new(mode, (200, 60), 255)
+            renderer.draw_cached_text(ImageDraw.Draw(actual), 13, 9, "Cloudy", font)
+            assert actual.tobytes() == expected.tobytes()
+
+    @pytest.mark.parametrize("align_y_center", [True, False])
+    def test_centered_cached_text_matches_draw_centered_text(self, renderer, align_y_center):
+        """Test sprite-based centered text lands where draw_centered_text puts it."""
+        from PIL import Image
+
+        font = ImageFont.load_default(size=24)
+        expected = Image.new("1", (200, 60), 255)
+        renderer.draw_centered_text(
+            ImageDraw.Draw(expected), 100, 30, "1234", font, align_y_center=align_y_center
+        )
+
+        actual = Image.new("1", (200, 60), 255)
+        renderer.draw_centered_cached_text(
+            ImageDraw.Draw(actual), 100, 30, "1234", font, align_y_center=align_y_center
+        )
+        assert actual.tobytes() == expected.tobytes()
+
+    @pytest.mark.parametrize("mode", ["1", "L"])
+    @pytest.mark.parametrize("text", ["09:26", "23:59", "10:01", "12:3+"])
+    def test_centered_atlas_text_matches_draw_centered_text(self, renderer, mode, text):
+        """Test glyph-atlas text draws the same pixels as draw_centered_text."""
+        from PIL import Image
+
+        font = ImageFont.load_default(size=28)
+        expected = Image.new(mode, (200, 60), 255)
+        renderer.draw_centered_text(ImageDraw.Draw(expected), 100, 10, text, font)
+
+        actual = Image.new(mode, (200, 60), 255)
+        renderer.draw_centered_atlas_text(ImageDraw.Draw(actual), 100, 10, text, font)
+        assert actual.tobytes() == expected.tobytes()
+
+    @pytest.mark.parametrize("max_width", [5, 120, 1000])
+    def test_fit_text_matches_draw_truncated_text(self, renderer, max_width):
+        """Test fit_text returns the text draw_truncated_text would draw."""
+        from PIL import Image
+
+        font = ImageFont.load_default(size=24)
+        text = "1. A fairly long Hacker News story title"
+        fitted = renderer.fit_text(text, font, max_width, "1")
+
+        expected = Image.new("1", (1000, 40), 255)
+        drawn = renderer.draw_truncated_text(ImageDraw.Draw(expected), 0, 0, text, font, max_width)
+        assert (fitted is None) == (drawn is None)
+
+        actual = Image.new("1", (1000, 40), 255)
+        if fitted is not None:
+            ImageDraw.Draw(actual).text((0, 0), fitted, font=font, fill=0)
+        assert actual.tobytes() == expected.tobytes()
+
+    def test_draw_truncated_text_keeps_longest_fitting_prefix(self, renderer, mock_draw, mock_font):
+        """Test truncation finds the longest prefix with few width measurements."""
+        mock_draw.textlength.side_effect = lambda text, font: len(text) * 10
+        text = "abcdefghijklmnopqrstuvwxyz" * 4
+
+        renderer.draw_truncated_text(mock_draw, 10, 10, text, mock_font, max_width=100)
+
+        # 100px fits 7 chars plus the 3-char ellipsis
+        assert mock_draw.text.call_args[0][1] == "abcdefg..."
+        assert mock_draw.textlength.call_count < 15